@@ -1,15 +1,19 @@
 #ifndef APID_CONTROLLER_H
 #define APID_CONTROLLER_H
 
+#include "pid_core.h"
+
 /**
  * @class aPIDController
  * @brief Adaptive PID Controller class for control systems.
  * 
  * This class implements a simple adaptive PID controller that can be used
  * to control a system by adjusting the output based on the error
- * between a target value and a measured value.
+ * between a target value and a measured value. Uses the shared PIDCore,
+ * so setpoint weighting, derivative filtering, output limits, and
+ * anti-windup are available.
  */
-class aPIDController {
+class aPIDController : public PIDCore {
 public:
     /**
      * @brief Constructor to initialize PID gains and time step.
@@ -26,51 +30,28 @@ public:
      * 
      * @param target The desired target value.
      * @param measured_value The current measured value.
+     * @param adapt Adaptation added to the output before saturation, e.g. an
+     * RBF prediction (default is 0.0).
      * @return The computed control output.
      */
-    double update(double target, double measured_value);
-
-    /** 
-     * @brief Set the proportional gain.
-     * @param kp The new proportional gain.
-     */
-    void set_Kp(double kp) {Kp = kp;}
-
-    /** 
-     * @brief Set the integral gain.
-     * @param ki The new integral gain.
-     */
-    void set_Ki(double ki) {Ki = ki;}
-
-    /** 
-     * @brief Set the derivative gain.
-     * @param kd The new derivative gain.
-     */
-    void set_Kd(double kd) {Kd = kd;}
+    double update(double target, double measured_value, double adapt = 0.0);
 
     /**
-     * @brief Get the proportional gain.
-     * @return The current proportional gain.
-     */
-    double get_Kp() const { return Kp; }
-
-    /**
-     * @brief Get the integral gain.
-     * @return The current integral gain.
-     */
-    double get_Ki() const { return Ki; }
-
-    /**
-     * @brief Get the derivative gain.
-     * @return The current derivative gain.
+     * @brief Update the PID output with an adaptation computed from the new terms.
+     * 
+     * @param target The desired target value.
+     * @param measured_value The current measured value.
+     * @param adapt Callable adapt(error, integral, derivative) returning the
+     * adaptation, e.g. an RBF prediction.
+     * @return The computed control output.
      */
-    double get_Kd() const { return Kd; }
+    template <typename Adapt>
+    double update_adaptive(double target, double measured_value, Adapt adapt) {
+        return PIDCore::update_adaptive(target, measured_value, dt, adapt);
+    }
 
 private:
-    double Kp, Ki, Kd;  // PID gains
     double dt;          // Time step
-    double integral;    // Integral term
-    double prev_err;    // Previous error
 };
 
 #endif // APID_CONTROLLER_H
@@ -28,12 +28,10 @@ int main() {
     for (int step = 0; step < 100; ++step) {
         double error = target - measured_value;
 
-        double control_signal = apid.update(target, measured_value);
-
         double gains[3] = {apid.get_Kp(), apid.get_Ki(), apid.get_Kd()};
         rbf.adapt(error, learning_rate, gains);
 
-        control_signal += rbf.predict(gains);
+        double control_signal = apid.update(target, measured_value, rbf.predict(gains));
         
         measured_value += simulate_system(control_signal, measured_value, dt);
 
@@ -59,12 +57,10 @@ int main() {
     for (int step = 0; step < 100; ++step) {
         double error = target - measured_value;
 
-        double control_signal = apid_new.update(target, measured_value);
-
         double gains[3] = {apid_new.get_Kp(), apid_new.get_Ki(), apid_new.get_Kd()};
         rbf_untrained.adapt(error, learning_rate, gains);
 
-        control_signal += rbf_untrained.predict(gains);
+        double control_signal = apid_new.update(target, measured_value, rbf_untrained.predict(gains));
         
         measured_value += simulate_system(control_signal, measured_value, dt);
 
@@ -0,0 +1,131 @@
+#include <chrono>
+#include <iomanip>
+#include <iostream>
+#include <thread>
+
+#include "rbf_model.h"
+#include "rbf_model_buffer.h"
+#include "rbf_lookup_table.h"
+#include "apid_controller.h"
+
+// Cross-implementation parity harness, driven by parity_test/test_parity.py.
+//
+// Reads from stdin (whitespace separated):
+//   n_centers input_dim sigma
+//   centers (n_centers x input_dim), weights (n_centers)
+//   n_samples, inputs (n_samples x input_dim)
+//   resolution, lower (input_dim), upper (input_dim)
+//   Kp Ki Kd dt n_steps, (target measured_value) x n_steps
+//   n_repeats
+// Writes one labelled line per output:
+//   predict, lut, buffer, pid: outputs for each sample or step, buffer from a model
+//   published by a writer thread, pid adapted by the model
+//   throughput_predict, throughput_lut: single input calls per second
+
+// Time n_repeats passes over all samples, return calls per second
+template <typename Predict>
+double throughput(Predict predict, const double* inputs, int n_samples, int input_dim, int n_repeats) {
+    volatile double sink = 0.0;
+    auto start = std::chrono::steady_clock::now();
+    for (int repeat = 0; repeat < n_repeats; ++repeat) {
+        for (int sample = 0; sample < n_samples; ++sample) {
+            sink = sink + predict(&inputs[sample * input_dim]);
+        }
+    }
+    std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+    return n_repeats * n_samples / elapsed.count();
+}
+
+int main() {
+    std::cout << std::setprecision(17);
+
+    int n_centers, input_dim;
+    double sigma;
+    std::cin >> n_centers >> input_dim >> sigma;
+
+    RBFModel rbf(n_centers, input_dim, sigma, false);
+    double* center = new double[input_dim];
+    for (int i = 0; i < n_centers; ++i) {
+        for (int j = 0; j < input_dim; ++j) std::cin >> center[j];
+        rbf.set_center(i, center);
+    }
+    delete[] center;
+    for (int i = 0; i < n_centers; ++i) {
+        double weight;
+        std::cin >> weight;
+        rbf.set_weight(i, weight);
+    }
+
+    int n_samples;
+    std::cin >> n_samples;
+    double* inputs = new double[n_samples * input_dim];
+    for (int i = 0; i < n_samples * input_dim; ++i) std::cin >> inputs[i];
+
+    int resolution;
+    std::cin >> resolution;
+    double* lower = new double[input_dim];
+    double* upper = new double[input_dim];
+    for (int j = 0; j < input_dim; ++j) std::cin >> lower[j];
+    for (int j = 0; j < input_dim; ++j) std::cin >> upper[j];
+    RBFLookupTable lut(rbf, lower, upper, resolution);
+
+    double Kp, Ki, Kd, dt;
+    int n_steps;
+    std::cin >> Kp >> Ki >> Kd >> dt >> n_steps;
+    aPIDController apid(Kp, Ki, Kd, dt);
+
+    // RBF adaptation from [error, integral, derivative], as in the Python controllers
+    auto adapt = [&](double error, double integral, double derivative) {
+        double terms[3] = {error, integral, derivative};
+        return rbf.predict(terms);
+    };
+
+    std::cout << "pid";
+    for (int step = 0; step < n_steps; ++step) {
+        double target, measured_value;
+        std::cin >> target >> measured_value;
+        std::cout << " " << apid.update_adaptive(target, measured_value, adapt);
+    }
+    std::cout << std::endl;
+
+    int n_repeats;
+    std::cin >> n_repeats;
+
+    std::cout << "predict";
+    for (int sample = 0; sample < n_samples; ++sample) {
+        std::cout << " " << rbf.predict(&inputs[sample * input_dim]);
+    }
+    std::cout << std::endl;
+
+    std::cout << "lut";
+    for (int sample = 0; sample < n_samples; ++sample) {
+        std::cout << " " << lut.predict(&inputs[sample * input_dim]);
+    }
+    std::cout << std::endl;
+
+    // Publish the model into a buffer from a writer thread, as a background trainer would
+    RBFModelBuffer buffer(n_centers, input_dim, sigma, false);
+    std::thread writer([&]() {
+        buffer.acquire_back().copy_from(rbf);
+        buffer.publish();
+    });
+    writer.join();
+
+    std::cout << "buffer";
+    for (int sample = 0; sample < n_samples; ++sample) {
+        std::cout << " " << buffer.predict(&inputs[sample * input_dim]);
+    }
+    std::cout << std::endl;
+
+    std::cout << "throughput_predict " 
+              << throughput([&](const double* x) { return rbf.predict(x); }, inputs, n_samples, input_dim, n_repeats)
+              << std::endl;
+    std::cout << "throughput_lut " 
+              << throughput([&](const double* x) { return lut.predict(x); }, inputs, n_samples, input_dim, n_repeats)
+              << std::endl;
+
+    delete[] inputs;
+    delete[] lower;
+    delete[] upper;
+    return 0;
+}
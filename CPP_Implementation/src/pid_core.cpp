@@ -0,0 +1,64 @@
+#include "pid_core.h"
+
+/**
+ * @brief Constructor to initialize PID gains.
+ */
+PIDCore::PIDCore(double kp, double ki, double kd)
+    : Kp(kp), Ki(ki), Kd(kd), b(1.0), c(1.0), Tf(0.0), u_min(-INFINITY), u_max(INFINITY),
+      integral(0.0), derivative(0.0), prev_err(0.0), error(0.0), error_p(0.0), prev_integral(0.0) {}
+
+/**
+ * @brief Update the PID output based on the target and measured value.
+ */
+double PIDCore::update(double target, double measured_value, double dt, double adapt) {
+    compute_terms(target, measured_value, dt);
+    return saturate(adapt);
+}
+
+/**
+ * @brief Compute the error, integral, and derivative terms for an update.
+ */
+void PIDCore::compute_terms(double target, double measured_value, double dt) {
+    error = target - measured_value;
+    error_p = b * target - measured_value;
+    double error_d = c * target - measured_value;
+
+    prev_integral = integral;
+    if (dt > 0.0) {
+        integral += error * dt;
+        double alpha = Tf / (Tf + dt);
+        derivative = alpha * derivative + (1.0 - alpha) * (error_d - prev_err) / dt;
+        prev_err = error_d;
+    }
+}
+
+/**
+ * @brief Combine the terms with the adaptation, apply anti-windup and output limits.
+ */
+double PIDCore::saturate(double adapt) {
+    double u = (Kp * error_p) + (Ki * integral) + (Kd * derivative) + adapt;
+
+    // Anti-windup, hold the integral while saturated in the direction the integral pushes
+    if ((u > u_max && Ki * error > 0.0) || (u < u_min && Ki * error < 0.0)) {
+        u -= Ki * (integral - prev_integral);
+        integral = prev_integral;
+    }
+
+    if (u > u_max) return u_max;
+    if (u < u_min) return u_min;
+    return u;
+}
+
+/**
+ * @brief Change gains without a bump in the output.
+ */
+void PIDCore::set_gains(double kp, double ki, double kd) {
+    set_gains_adaptive(kp, ki, kd, [](double, double, double) { return 0.0; });
+}
+
+/**
+ * @brief Initialize the state so the next output continues from u.
+ */
+void PIDCore::bumpless_transfer(double u, double target, double measured_value) {
+    bumpless_transfer_adaptive(u, target, measured_value, [](double, double, double) { return 0.0; });
+}
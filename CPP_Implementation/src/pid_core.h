@@ -0,0 +1,258 @@
+#ifndef PID_CORE_H
+#define PID_CORE_H
+
+#include <cmath>
+
+/**
+ * @class PIDCore
+ * @brief PID core shared by the adaptive PID controllers.
+ * 
+ * Computes the PID terms with setpoint weighting, a first order derivative
+ * filter, output saturation, and anti-windup by conditional integration.
+ * The integral is held while the output is saturated and the integral term
+ * would push it further. Timesteps that are not positive skip integration and
+ * hold the derivative. The defaults reproduce a plain PID on the error.
+ * For many loops, keep an array of cores; each holds only a few doubles.
+ */
+class PIDCore {
+public:
+    /**
+     * @brief Constructor to initialize PID gains.
+     * 
+     * @param kp Proportional gain.
+     * @param ki Integral gain.
+     * @param kd Derivative gain.
+     */
+    PIDCore(double kp=0.0, double ki=0.0, double kd=0.0);
+
+    /**
+     * @brief Update the PID output based on the target and measured value.
+     * 
+     * @param target The desired target value.
+     * @param measured_value The current measured value.
+     * @param dt Time step.
+     * @param adapt Adaptation added to the output before saturation (default is 0.0).
+     * @return The computed control output.
+     */
+    double update(double target, double measured_value, double dt, double adapt = 0.0);
+
+    /**
+     * @brief Update the PID output with an adaptation computed from the new terms.
+     * 
+     * Matches the Python core, where the RBF input is the error, integral,
+     * and derivative of this update.
+     * 
+     * @param target The desired target value.
+     * @param measured_value The current measured value.
+     * @param dt Time step.
+     * @param adapt Callable adapt(error, integral, derivative) returning the
+     * adaptation added to the output before saturation.
+     * @return The computed control output.
+     */
+    template <typename Adapt>
+    double update_adaptive(double target, double measured_value, double dt, Adapt adapt) {
+        compute_terms(target, measured_value, dt);
+        return saturate(adapt(error, integral, derivative));
+    }
+
+    /**
+     * @brief Change gains without a bump in the output.
+     * 
+     * The integral absorbs the change in the proportional and derivative terms
+     * of the last update, so the same inputs give the same output. With a zero
+     * new Ki the integral is kept as is and the output can jump.
+     * 
+     * @param kp The new proportional gain.
+     * @param ki The new integral gain.
+     * @param kd The new derivative gain.
+     */
+    void set_gains(double kp, double ki, double kd);
+
+    /**
+     * @brief Change gains without a bump in the adapted output.
+     * 
+     * The integral is an input of the adaptation, so it is solved for with
+     * the adaptation included, as in the Python core.
+     * 
+     * @param kp The new proportional gain.
+     * @param ki The new integral gain.
+     * @param kd The new derivative gain.
+     * @param adapt Callable adapt(error, integral, derivative), as in update_adaptive.
+     */
+    template <typename Adapt>
+    void set_gains_adaptive(double kp, double ki, double kd, Adapt adapt) {
+        double u = Kp * error_p + Ki * integral + Kd * derivative + adapt(error, integral, derivative);
+        if (ki != 0.0) integral = solve_integral(u, kp * error_p + kd * derivative, ki, adapt);
+        Kp = kp;
+        Ki = ki;
+        Kd = kd;
+    }
+
+    /**
+     * @brief Initialize the state so the next output continues from u, e.g. when
+     * switching from manual to automatic control.
+     * 
+     * @param u The control signal currently applied.
+     * @param target The desired target value.
+     * @param measured_value The current measured value.
+     */
+    void bumpless_transfer(double u, double target, double measured_value);
+
+    /**
+     * @brief Initialize the state so the next adapted output continues from u.
+     * 
+     * @param u The control signal currently applied.
+     * @param target The desired target value.
+     * @param measured_value The current measured value.
+     * @param adapt Callable adapt(error, integral, derivative), as in update_adaptive.
+     */
+    template <typename Adapt>
+    void bumpless_transfer_adaptive(double u, double target, double measured_value, Adapt adapt) {
+        error = target - measured_value;
+        error_p = b * target - measured_value;
+        derivative = 0.0;
+        prev_err = c * target - measured_value;
+        integral = (Ki != 0.0) ? solve_integral(u, Kp * error_p, Ki, adapt) : 0.0;
+    }
+
+    /** 
+     * @brief Set the proportional gain.
+     * @param kp The new proportional gain.
+     */
+    void set_Kp(double kp) {Kp = kp;}
+
+    /** 
+     * @brief Set the integral gain.
+     * @param ki The new integral gain.
+     */
+    void set_Ki(double ki) {Ki = ki;}
+
+    /** 
+     * @brief Set the derivative gain.
+     * @param kd The new derivative gain.
+     */
+    void set_Kd(double kd) {Kd = kd;}
+
+    /**
+     * @brief Set the setpoint weights of the proportional and derivative terms.
+     * @param b_weight The proportional setpoint weight.
+     * @param c_weight The derivative setpoint weight.
+     */
+    void set_setpoint_weights(double b_weight, double c_weight) {b = b_weight; c = c_weight;}
+
+    /**
+     * @brief Set the derivative filter time constant.
+     * @param tf The time constant, 0 for no filter.
+     */
+    void set_derivative_filter(double tf) {Tf = tf;}
+
+    /**
+     * @brief Set the output limits.
+     * @param min The lower output limit.
+     * @param max The upper output limit.
+     */
+    void set_output_limits(double min, double max) {u_min = min; u_max = max;}
+
+    /**
+     * @brief Get the proportional gain.
+     * @return The current proportional gain.
+     */
+    double get_Kp() const { return Kp; }
+
+    /**
+     * @brief Get the integral gain.
+     * @return The current integral gain.
+     */
+    double get_Ki() const { return Ki; }
+
+    /**
+     * @brief Get the derivative gain.
+     * @return The current derivative gain.
+     */
+    double get_Kd() const { return Kd; }
+
+    /**
+     * @brief Get the integral term.
+     * @return The current integral.
+     */
+    double get_integral() const { return integral; }
+
+    /**
+     * @brief Get the derivative term.
+     * @return The current (filtered) derivative.
+     */
+    double get_derivative() const { return derivative; }
+
+    /**
+     * @brief Get the error of the last update.
+     * @return The last error.
+     */
+    double get_error() const { return error; }
+
+protected:
+    double Kp, Ki, Kd;      // PID gains
+    double b, c;            // Setpoint weights
+    double Tf;              // Derivative filter time constant
+    double u_min, u_max;    // Output limits
+    double integral;        // Integral term
+    double derivative;      // Filtered derivative term
+    double prev_err;        // Previous derivative error
+    double error;           // Error of the last update
+    double error_p;         // Proportional error of the last update
+    double prev_integral;   // Integral before the last update, for anti-windup
+
+    /**
+     * @brief Compute the error, integral, and derivative terms for an update.
+     * 
+     * @param target The desired target value.
+     * @param measured_value The current measured value.
+     * @param dt Time step.
+     */
+    void compute_terms(double target, double measured_value, double dt);
+
+    /**
+     * @brief Combine the terms with the adaptation, apply anti-windup and output limits.
+     * 
+     * @param adapt Adaptation added to the output before saturation.
+     * @return The computed control output.
+     */
+    double saturate(double adapt);
+
+    static const int SOLVE_ITERATIONS = 20;  // Secant iterations when solving for the integral
+
+    /**
+     * @brief Integral that makes terms + ki * integral + adapt(error, integral, derivative) equal u.
+     * 
+     * Secant iteration from the solution without adaptation, keeping the best iterate.
+     * 
+     * @param u The output to continue from.
+     * @param terms The proportional and derivative terms.
+     * @param ki The integral gain, not zero.
+     * @param adapt Callable adapt(error, integral, derivative).
+     * @return The integral.
+     */
+    template <typename Adapt>
+    double solve_integral(double u, double terms, double ki, Adapt adapt) const {
+        auto residual = [&](double value) { return terms + ki * value + adapt(error, value, derivative) - u; };
+        double prev = (u - terms) / ki;
+        double r_prev = residual(prev);
+        double best = prev;
+        double r_best = std::fabs(r_prev);
+        double value = prev - r_prev / ki;
+        for (int i = 0; i < SOLVE_ITERATIONS && r_best > 1e-12 * (1.0 + std::fabs(u)); ++i) {
+            double r = residual(value);
+            if (std::fabs(r) < r_best) {
+                best = value;
+                r_best = std::fabs(r);
+            }
+            double slope = (r - r_prev) / (value - prev);
+            if (!std::isfinite(slope) || slope == 0.0) slope = ki;
+            prev = value;
+            r_prev = r;
+            value -= r / slope;
+        }
+        return best;
+    }
+};
+
+#endif // PID_CORE_H
@@ -0,0 +1,99 @@
+#include <climits>
+
+#include "rbf_lookup_table.h"
+
+/**
+ * @brief Constructor to sample the model onto the grid.
+ */
+RBFLookupTable::RBFLookupTable(RBFModel& model, const double* lower, const double* upper, int resolution)
+    : values(nullptr), lower(nullptr), step(nullptr), strides(nullptr), input_dim(model.get_input_dim()),
+      resolution(resolution), error_bound(INFINITY) {
+    // Check the input count and grid size before allocating
+    if (input_dim < 1 || input_dim > MAX_INPUT_DIM) return;
+    if (resolution < 2) return; // Needs two points per input to interpolate
+    int n_points = 1;
+    for (int i = 0; i < input_dim; ++i) {
+        if (!(upper[i] > lower[i])) return; // Inverted, empty, or NaN bounds
+        if (n_points > INT_MAX / this->resolution) return; // Grid index would overflow
+        n_points *= this->resolution;
+    }
+
+    this->lower = new double[input_dim];
+    step = new double[input_dim];
+    strides = new int[input_dim];
+
+    int stride = 1;
+    double step_sum = 0.0;
+    for (int i = input_dim - 1; i >= 0; --i) {
+        this->lower[i] = lower[i];
+        step[i] = (upper[i] - lower[i]) / (this->resolution - 1);
+        strides[i] = stride;
+        stride *= this->resolution;
+        step_sum += step[i] * step[i];
+    }
+    values = new double[n_points];
+
+    // Sample the model at every grid point
+    double* point = new double[input_dim];
+    for (int n = 0; n < n_points; ++n) {
+        for (int i = 0; i < input_dim; ++i) {
+            point[i] = this->lower[i] + step[i] * ((n / strides[i]) % this->resolution);
+        }
+        values[n] = model.predict(point);
+    }
+    delete[] point;
+
+    double weight_sum = 0.0;
+    for (int i = 0; i < model.get_n_centers(); ++i) {
+        weight_sum += fabs(model.get_weight(i));
+    }
+    double sigma = model.get_sigma();
+    error_bound = weight_sum / (sigma * sigma) * step_sum / 8.0;
+}
+
+/**
+ * @brief Destructor to free allocated memory.
+ */
+RBFLookupTable::~RBFLookupTable() {
+    delete[] values;
+    delete[] lower;
+    delete[] step;
+    delete[] strides;
+}
+
+/**
+ * @brief Predict the interpolated RBF output for a given input.
+ */
+double RBFLookupTable::predict(const double* input) const {
+    if (!values) return 0.0; // Invalid table
+
+    int base = 0;
+    double fraction[MAX_INPUT_DIM];
+    for (int i = 0; i < input_dim; ++i) {
+        double position = (input[i] - lower[i]) / step[i];
+        if (position < 0.0) position = 0.0;
+        if (position > resolution - 1) position = resolution - 1;
+
+        int index = static_cast<int>(position);
+        if (index > resolution - 2) index = resolution - 2;
+        fraction[i] = position - index;
+        base += index * strides[i];
+    }
+
+    // Weighted sum over the 2^input_dim surrounding grid points
+    double output = 0.0;
+    for (int corner = 0; corner < (1 << input_dim); ++corner) {
+        double weight = 1.0;
+        int offset = base;
+        for (int i = 0; i < input_dim; ++i) {
+            if (corner & (1 << i)) {
+                weight *= fraction[i];
+                offset += strides[i];
+            } else {
+                weight *= 1.0 - fraction[i];
+            }
+        }
+        output += weight * values[offset];
+    }
+    return output;
+}
@@ -0,0 +1,76 @@
+#ifndef RBF_LOOKUP_TABLE_H
+#define RBF_LOOKUP_TABLE_H
+
+#include "rbf_model.h"
+
+/**
+ * @class RBFLookupTable
+ * @brief Lookup table of a trained RBF model with multilinear interpolation.
+ * 
+ * Samples an RBF model onto a regular grid once, then predicts by
+ * interpolating the 2^input_dim surrounding grid points (trilinear for
+ * 3 inputs). Prediction cost is independent of the number of centers and
+ * needs no exp calls. Inputs outside the bounds are clamped to the grid edge.
+ * 
+ * Construction fails if the resolution is less than 2, any upper bound is not
+ * greater than its lower bound, the input dimension exceeds MAX_INPUT_DIM, or
+ * the grid has more points than an int can index. A failed table is not valid, predicts 0.0, and reports an
+ * infinite error bound.
+ */
+class RBFLookupTable {
+public:
+    static const int MAX_INPUT_DIM = 16; // Largest supported input dimension
+
+    /**
+     * @brief Constructor to sample the model onto the grid.
+     * 
+     * @param model The trained RBF model to sample.
+     * @param lower A pointer to an array of lower bounds, one per input.
+     * @param upper A pointer to an array of upper bounds, one per input, each greater than its lower bound.
+     * @param resolution The number of grid points per input (at least 2, default is 32).
+     */
+    RBFLookupTable(RBFModel& model, const double* lower, const double* upper, int resolution = 32);
+
+    /**
+     * @brief Destructor to free allocated memory.
+     */
+    ~RBFLookupTable();
+
+    RBFLookupTable(const RBFLookupTable&) = delete;
+    RBFLookupTable& operator=(const RBFLookupTable&) = delete;
+
+    /**
+     * @brief Predict the interpolated RBF output for a given input.
+     * 
+     * @param input A pointer to an array of input values.
+     * @return The interpolated output of the RBF model.
+     */
+    double predict(const double* input) const;
+
+    /**
+     * @brief Get the maximum interpolation error inside the bounds.
+     * 
+     * Uses |d2/dx2 exp(-x^2 / (2 sigma^2))| <= 1 / sigma^2 along each input,
+     * giving sum(|weights|) / sigma^2 * sum(step^2) / 8.
+     * 
+     * @return The error bound.
+     */
+    double get_error_bound() const { return error_bound; }
+
+    /**
+     * @brief Check whether the table was built successfully.
+     * @return True if the bounds and grid size were valid.
+     */
+    bool is_valid() const { return values != nullptr; }
+
+private:
+    double* values;     // Model output at each grid point
+    double* lower;      // Lower bound of each input
+    double* step;       // Grid spacing of each input
+    int* strides;       // Index stride of each input
+    int input_dim;      // Dimension of the input
+    int resolution;     // Grid points per input
+    double error_bound; // Maximum interpolation error
+};
+
+#endif // RBF_LOOKUP_TABLE_H
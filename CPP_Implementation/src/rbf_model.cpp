@@ -102,3 +102,28 @@ void RBFModel::set_weight(int index, double value) {
     if (index < 0 || index >= n_centers) return;
     weights[index] = value;
 }
+
+/**
+ * @brief Set the center at a specific index.
+ */
+void RBFModel::set_center(int index, const double* center) {
+    if (index < 0 || index >= n_centers) return;
+    for (int j = 0; j < input_dim; ++j) {
+        centers[index][j] = center[j];
+    }
+}
+
+/**
+ * @brief Copy centers, weights, and spread from another model.
+ */
+bool RBFModel::copy_from(const RBFModel& other) {
+    if (other.n_centers != n_centers || other.input_dim != input_dim) return false;
+    for (int i = 0; i < n_centers; ++i) {
+        for (int j = 0; j < input_dim; ++j) {
+            centers[i][j] = other.centers[i][j];
+        }
+        weights[i] = other.weights[i];
+    }
+    sigma = other.sigma;
+    return true;
+}
@@ -76,6 +76,42 @@ public:
      */
     void set_weight(int index, double value);
 
+    /**
+     * @brief Set the center at a specific index.
+     * 
+     * @param index The index of the center to set.
+     * @param center A pointer to an array of input_dim center values.
+     */
+    void set_center(int index, const double* center);
+
+    /**
+     * @brief Copy centers, weights, and spread from another model.
+     * 
+     * Both models must have the same number of centers and input dimensions.
+     * 
+     * @param other The model to copy from.
+     * @return True if the models matched and were copied, false otherwise.
+     */
+    bool copy_from(const RBFModel& other);
+
+    /**
+     * @brief Get the number of RBF centers.
+     * @return The number of centers.
+     */
+    int get_n_centers() const { return n_centers; }
+
+    /**
+     * @brief Get the dimension of the input.
+     * @return The input dimension.
+     */
+    int get_input_dim() const { return input_dim; }
+
+    /**
+     * @brief Get the spread of the RBFs.
+     * @return The current sigma.
+     */
+    double get_sigma() const { return sigma; }
+
 private:
     double** centers; // 2D array for centers
     double* weights;  // Array of weights
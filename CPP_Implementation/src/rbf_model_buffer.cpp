@@ -0,0 +1,93 @@
+#include <thread>
+
+#include "rbf_model_buffer.h"
+
+/**
+ * @brief Constructor to initialize both models identically.
+ */
+RBFModelBuffer::RBFModelBuffer(int n_centers, int input_dim, double sigma, bool random_centers)
+    : front(0) {
+    models[0] = new RBFModel(n_centers, input_dim, sigma, random_centers);
+    models[1] = new RBFModel(n_centers, input_dim, sigma, false);
+    models[1]->copy_from(*models[0]);
+    readers[0].store(0);
+    readers[1].store(0);
+}
+
+/**
+ * @brief Destructor to free allocated memory.
+ */
+RBFModelBuffer::~RBFModelBuffer() {
+    delete models[0];
+    delete models[1];
+}
+
+/**
+ * @brief Predict the output of the published model.
+ */
+double RBFModelBuffer::predict(const double* input) {
+    int index = acquire_front();
+    double output = models[index]->predict(input);
+    readers[index].fetch_sub(1);
+    return output;
+}
+
+/**
+ * @brief Get the back model for writing, synchronized with the published model.
+ */
+RBFModel& RBFModelBuffer::acquire_back() {
+    int index = front.load();
+    int back = 1 - index;
+    while (readers[back].load() != 0) { // Wait for readers still on the old front
+        std::this_thread::yield();
+    }
+    models[back]->copy_from(*models[index]);
+    return *models[back];
+}
+
+/**
+ * @brief Publish the back model so the next prediction uses it.
+ */
+void RBFModelBuffer::publish() {
+    front.store(1 - front.load());
+}
+
+/**
+ * @brief Adapt weights on the back model and publish.
+ */
+void RBFModelBuffer::adapt(double error, double learning_rate, const double* input) {
+    acquire_back().adapt(error, learning_rate, input);
+    publish();
+}
+
+/**
+ * @brief Train the back model using recorded data and publish.
+ */
+void RBFModelBuffer::train(const double* inputs, const double* targets, int n_samples, int epochs, double learning_rate) {
+    acquire_back().train(inputs, targets, n_samples, epochs, learning_rate);
+    publish();
+}
+
+/**
+ * @brief Get the weight at a specific index of the published model.
+ */
+double RBFModelBuffer::get_weight(int index) {
+    int model = acquire_front();
+    double weight = models[model]->get_weight(index);
+    readers[model].fetch_sub(1);
+    return weight;
+}
+
+/**
+ * @brief Register as a reader of the published model.
+ */
+int RBFModelBuffer::acquire_front() {
+    int index = front.load();
+    readers[index].fetch_add(1);
+    while (front.load() != index) { // Published while registering, move to the new front
+        readers[index].fetch_sub(1);
+        index = front.load();
+        readers[index].fetch_add(1);
+    }
+    return index;
+}
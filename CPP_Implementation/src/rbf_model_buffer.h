@@ -0,0 +1,105 @@
+#ifndef RBF_MODEL_BUFFER_H
+#define RBF_MODEL_BUFFER_H
+
+#include <atomic>
+
+#include "rbf_model.h"
+
+/**
+ * @class RBFModelBuffer
+ * @brief Double-buffered RBF model for training alongside a live controller.
+ * 
+ * Holds a front model used for predictions and a back model used for
+ * training. A single writer thread trains the back model and publishes it
+ * with one atomic store, so the control loop picks up the new centers and
+ * weights at its next prediction without locks or pauses. Readers only ever
+ * retry, never wait; the writer waits for readers still on the old front
+ * before overwriting it.
+ */
+class RBFModelBuffer {
+public:
+    /**
+     * @brief Constructor to initialize both models identically.
+     * 
+     * @param n_centers The number of radial basis function centers.
+     * @param input_dim The dimensionality of the input data.
+     * @param sigma The spread of the RBFs (default is 1.0).
+     * @param random_centers Boolean to initialize centers randomly (default is true).
+     */
+    RBFModelBuffer(int n_centers, int input_dim, double sigma = 1.0, bool random_centers = true);
+
+    /**
+     * @brief Destructor to free allocated memory.
+     */
+    ~RBFModelBuffer();
+
+    RBFModelBuffer(const RBFModelBuffer&) = delete;
+    RBFModelBuffer& operator=(const RBFModelBuffer&) = delete;
+
+    /**
+     * @brief Predict the output of the published model. Safe to call from the
+     * control loop while another thread trains.
+     * 
+     * @param input A pointer to an array of input values.
+     * @return The computed output of the published model.
+     */
+    double predict(const double* input);
+
+    /**
+     * @brief Get the back model for writing, synchronized with the published model.
+     * 
+     * Only one writer thread may use the back model at a time.
+     * 
+     * @return The back model, ready to be adapted or trained.
+     */
+    RBFModel& acquire_back();
+
+    /**
+     * @brief Publish the back model so the next prediction uses it.
+     */
+    void publish();
+
+    /**
+     * @brief Adapt weights on the back model and publish.
+     * 
+     * @param error The difference between the desired output and the actual output.
+     * @param learning_rate The rate at which the weights are adjusted.
+     * @param input A pointer to an array of input values used for adaptation.
+     */
+    void adapt(double error, double learning_rate, const double* input);
+
+    /**
+     * @brief Train the back model using recorded data and publish.
+     * 
+     * @param inputs A pointer to an array of input samples (n_samples x input_dim).
+     * @param targets A pointer to an array of target outputs (n_samples).
+     * @param n_samples The number of samples to train on.
+     * @param epochs The number of training epochs to perform.
+     * @param learning_rate The learning rate for weight adaptation.
+     */
+    void train(const double* inputs, const double* targets, int n_samples, int epochs, double learning_rate);
+
+    /**
+     * @brief Get the weight at a specific index of the published model.
+     * 
+     * @param index The index of the weight to retrieve.
+     * @return The weight at the specified index.
+     */
+    double get_weight(int index);
+
+private:
+    RBFModel* models[2];          // Front and back models
+    std::atomic<int> front;       // Index of the published model
+    std::atomic<int> readers[2];  // Readers currently using each model
+
+    /**
+     * @brief Register as a reader of the published model.
+     * 
+     * The caller must decrement the reader count of the returned index when done.
+     * 
+     * @return The index of the published model.
+     */
+    int acquire_front();
+};
+
+#endif // RBF_MODEL_BUFFER_H
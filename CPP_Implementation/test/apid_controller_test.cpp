@@ -93,3 +93,109 @@ TEST_F(aPIDControllerTest, Derivative_Action) {
     double expectedDerivative = (target - measured_value)/0.1 - (target - 5.0)/0.1; 
     EXPECT_NEAR(controlSignal, Kd * expectedDerivative, 1e-5); 
 }
+
+// Test case for output saturation and anti-windup
+TEST_F(aPIDControllerTest, Saturation_And_Anti_Windup) {
+    apid->set_gains(1.0, 1.0, 0.0);
+    apid->set_output_limits(-1.0, 1.0);
+
+    for (int i = 0; i < 50; ++i) {
+        EXPECT_EQ(apid->update(10.0, 0.0), 1.0);
+    }
+    EXPECT_EQ(apid->get_integral(), 0.0);
+    EXPECT_LT(apid->update(0.0, 1.0), 0.0);
+}
+
+// Test case for anti-windup of a reverse acting loop with negative gains
+TEST_F(aPIDControllerTest, Reverse_Acting_Anti_Windup) {
+    apid->set_gains(-1.0, -1.0, 0.0);
+    apid->set_output_limits(-1.0, 1.0);
+
+    for (int i = 0; i < 50; ++i) {
+        EXPECT_EQ(apid->update(0.0, 10.0), 1.0);
+    }
+    EXPECT_EQ(apid->get_integral(), 0.0);
+    EXPECT_LT(apid->update(0.0, -1.0), 0.0);
+}
+
+// Test case for the adaptation added before saturation
+TEST_F(aPIDControllerTest, Adaptation) {
+    apid->set_Ki(0.0);
+    apid->set_Kd(0.0);
+    EXPECT_NEAR(apid->update(2.0, 1.0, 0.5), 1.5, 1e-12);
+
+    apid->set_output_limits(-1.0, 1.0);
+    EXPECT_EQ(apid->update(2.0, 1.0, 0.5), 1.0);
+}
+
+// Test case for derivative filtering
+TEST_F(aPIDControllerTest, Derivative_Filter) {
+    apid->set_derivative_filter(0.4);
+    apid->update(1.0, 1.0);
+    apid->update(1.0, 0.0);
+
+    EXPECT_NEAR(apid->get_derivative(), 0.2 * 1.0 / 0.1, 1e-12);
+}
+
+// Test case for setpoint weighting
+TEST_F(aPIDControllerTest, Setpoint_Weighting) {
+    apid->set_gains(2.0, 0.0, 1.0);
+    apid->set_setpoint_weights(0.5, 0.0);
+
+    double control_signal = apid->update(4.0, 1.0);
+    EXPECT_NEAR(control_signal, 2.0 * (0.5 * 4.0 - 1.0) + (-1.0 / 0.1), 1e-9);
+}
+
+// Test case for a non positive time step
+TEST(PIDCoreTest, Zero_Time_Step) {
+    PIDCore pid(1.0, 1.0, 1.0);
+    pid.update(1.0, 0.0, 0.1);
+    double integral = pid.get_integral();
+    double derivative = pid.get_derivative();
+
+    EXPECT_TRUE(std::isfinite(pid.update(1.0, 0.5, 0.0)));
+    EXPECT_EQ(pid.get_integral(), integral);
+    EXPECT_EQ(pid.get_derivative(), derivative);
+}
+
+// Test case for bumpless transfer and gain changes
+TEST(PIDCoreTest, Bumpless_Transfer) {
+    PIDCore pid(2.0, 0.5, 0.1);
+    pid.bumpless_transfer(3.0, 1.0, 0.5);
+    EXPECT_NEAR(pid.update(1.0, 0.5, 0.0), 3.0, 1e-12);
+
+    pid.update(1.0, 0.5, 0.1);
+    double control_signal = pid.update(1.0, 0.5, 0.0);
+    pid.set_gains(4.0, 1.0, 0.3);
+    EXPECT_NEAR(pid.update(1.0, 0.5, 0.0), control_signal, 1e-12);
+}
+
+// Test case for bumpless transfer and gain changes with an RBF adaptation
+TEST(PIDCoreTest, Bumpless_Transfer_Adaptive) {
+    auto adapt = [](double e, double i, double d) {
+        return 1.5 * std::exp(-((e - 0.5) * (e - 0.5) + (i - 0.3) * (i - 0.3) + d * d) / 2.0);
+    };
+    PIDCore pid(2.0, 0.5, 0.1);
+    pid.bumpless_transfer_adaptive(1.25, 1.0, 0.5, adapt);
+    EXPECT_GT(adapt(0.5, pid.get_integral(), 0.0), 0.5);
+    EXPECT_NEAR(pid.update_adaptive(1.0, 0.5, 0.0, adapt), 1.25, 1e-12);
+
+    pid.update_adaptive(1.0, 0.5, 0.1, adapt);
+    double control_signal = pid.update_adaptive(1.0, 0.5, 0.0, adapt);
+    pid.set_gains_adaptive(4.0, 1.0, 0.3, adapt);
+    EXPECT_NEAR(pid.update_adaptive(1.0, 0.5, 0.0, adapt), control_signal, 1e-12);
+}
+
+// Test case for adaptation computed from the new PID terms
+TEST_F(aPIDControllerTest, Adaptive_Update) {
+    double seen[3] = {0.0, 0.0, 0.0};
+    double control_signal = apid->update_adaptive(2.0, 1.0, [&](double e, double i, double d) {
+        seen[0] = e; seen[1] = i; seen[2] = d;
+        return 0.5;
+    });
+
+    EXPECT_NEAR(seen[0], 1.0, 1e-12);
+    EXPECT_NEAR(seen[1], 0.1, 1e-12);
+    EXPECT_NEAR(seen[2], 10.0, 1e-12);
+    EXPECT_NEAR(control_signal, 1.0 * 1.0 + 0.1 * 0.1 + 0.01 * 10.0 + 0.5, 1e-12);
+}
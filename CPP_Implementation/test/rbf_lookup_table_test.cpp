@@ -0,0 +1,92 @@
+#include <gtest/gtest.h>
+#include "rbf_lookup_table.h"
+
+// Test fixture for RBFLookupTable
+class RBFLookupTableTest : public ::testing::Test {
+protected:
+    void SetUp() override {
+        // Set up a trained RBF model with 5 centers and 3D input
+        n_centers = 5;
+        input_dim = 3;
+        rbf = new RBFModel(n_centers, input_dim);
+        for (int i = 0; i < n_centers; ++i) {
+            rbf->set_weight(i, 1.0 - 0.5 * i);
+        }
+    }
+
+    void TearDown() override {
+        delete rbf;
+    }
+
+    RBFModel* rbf;
+    int n_centers;
+    int input_dim;
+    double lower[3] = {-1.0, -1.0, -1.0};
+    double upper[3] = {2.0, 2.0, 2.0};
+};
+
+// Test grid points match the model exactly
+TEST_F(RBFLookupTableTest, Grid_Points_Exact) {
+    RBFLookupTable lut(*rbf, lower, upper, 16);
+    EXPECT_NEAR(lut.predict(lower), rbf->predict(lower), 1e-12);
+    EXPECT_NEAR(lut.predict(upper), rbf->predict(upper), 1e-12);
+}
+
+// Test interpolated outputs stay within the error bound
+TEST_F(RBFLookupTableTest, Predict_Within_Error_Bound) {
+    RBFLookupTable lut(*rbf, lower, upper, 16);
+    for (int sample = 0; sample < 200; ++sample) {
+        double input[3];
+        for (int i = 0; i < input_dim; ++i) {
+            input[i] = lower[i] + (upper[i] - lower[i]) * static_cast<double>(rand()) / RAND_MAX;
+        }
+        EXPECT_NEAR(lut.predict(input), rbf->predict(input), lut.get_error_bound());
+    }
+}
+
+// Test finer grids give smaller error bounds
+TEST_F(RBFLookupTableTest, Resolution_Error_Bound) {
+    RBFLookupTable lut_coarse(*rbf, lower, upper, 8);
+    RBFLookupTable lut_fine(*rbf, lower, upper, 32);
+    EXPECT_GT(lut_coarse.get_error_bound(), lut_fine.get_error_bound());
+}
+
+// Test inputs outside the bounds are clamped
+TEST_F(RBFLookupTableTest, Clamp_Outside_Bounds) {
+    RBFLookupTable lut(*rbf, lower, upper, 16);
+    double input[] = {5.0, 5.0, 5.0};
+    EXPECT_NEAR(lut.predict(input), lut.predict(upper), 1e-12);
+}
+
+// Test inverted and zero width bounds give an invalid table
+TEST_F(RBFLookupTableTest, Invalid_Bounds) {
+    RBFLookupTable lut_inverted(*rbf, upper, lower, 16);
+    EXPECT_FALSE(lut_inverted.is_valid());
+    EXPECT_EQ(lut_inverted.predict(lower), 0.0);
+    EXPECT_TRUE(std::isinf(lut_inverted.get_error_bound()));
+
+    RBFLookupTable lut_empty(*rbf, lower, lower, 16);
+    EXPECT_FALSE(lut_empty.is_valid());
+
+    RBFLookupTable lut(*rbf, lower, upper, 16);
+    EXPECT_TRUE(lut.is_valid());
+}
+
+// Test grids too large to index give an invalid table
+TEST_F(RBFLookupTableTest, Grid_Overflow) {
+    RBFLookupTable lut(*rbf, lower, upper, 2000);
+    EXPECT_FALSE(lut.is_valid());
+}
+
+// Test resolutions below two points per input give an invalid table
+TEST_F(RBFLookupTableTest, Invalid_Resolution) {
+    RBFLookupTable lut_one(*rbf, lower, upper, 1);
+    EXPECT_FALSE(lut_one.is_valid());
+    EXPECT_EQ(lut_one.predict(lower), 0.0);
+
+    RBFLookupTable lut_negative(*rbf, lower, upper, -4);
+    EXPECT_FALSE(lut_negative.is_valid());
+
+    RBFLookupTable lut_two(*rbf, lower, upper, 2);
+    EXPECT_TRUE(lut_two.is_valid());
+}
@@ -0,0 +1,85 @@
+#include <gtest/gtest.h>
+#include <thread>
+#include "rbf_model_buffer.h"
+
+// Test fixture for RBFModelBuffer
+class RBFModelBufferTest : public ::testing::Test {
+protected:
+    void SetUp() override {
+        // Set up a buffer with 5 centers, 3D input, and fixed centers
+        n_centers = 5;
+        input_dim = 3;
+        buffer = new RBFModelBuffer(n_centers, input_dim, 1.0, false);
+    }
+
+    void TearDown() override {
+        delete buffer;
+    }
+
+    RBFModelBuffer* buffer;
+    int n_centers;
+    int input_dim;
+};
+
+// Test both models start identical to a plain model
+TEST_F(RBFModelBufferTest, Predict_Matches_Model) {
+    RBFModel rbf(n_centers, input_dim, 1.0, false);
+    double input[] = {0.5, 0.5, 0.5};
+    EXPECT_EQ(buffer->predict(input), rbf.predict(input));
+}
+
+// Test back model changes only show after publishing
+TEST_F(RBFModelBufferTest, Publish_Swaps_Model) {
+    double input[] = {0.5, 0.5, 0.5};
+    RBFModel& back = buffer->acquire_back();
+    for (int i = 0; i < n_centers; ++i) {
+        back.set_weight(i, 1.0);
+    }
+    EXPECT_EQ(buffer->predict(input), 0.0);
+
+    buffer->publish();
+    EXPECT_GT(buffer->predict(input), 0.0);
+
+    // The next back model starts from the published one
+    RBFModel& next = buffer->acquire_back();
+    EXPECT_EQ(next.get_weight(0), 1.0);
+}
+
+// Test adaptation publishes on each call
+TEST_F(RBFModelBufferTest, Adapt_Publishes) {
+    double input[] = {1.0, 1.0, 1.0};
+    buffer->adapt(0.5, 0.1, input);
+    double first = buffer->get_weight(1);
+    EXPECT_NE(first, 0.0);
+
+    buffer->adapt(0.5, 0.1, input);
+    EXPECT_GT(buffer->get_weight(1), first);
+}
+
+// Test background training while the control loop keeps predicting
+TEST_F(RBFModelBufferTest, Background_Train) {
+    double inputs[] = {
+        0.0, 0.0, 0.0,
+        1.0, 1.0, 1.0,
+        2.0, 2.0, 2.0
+    };
+    double targets[] = {0.0, 1.0, 0.0};
+    double input[] = {1.0, 1.0, 1.0};
+
+    std::thread trainer([&]() {
+        for (int round = 0; round < 50; ++round) {
+            buffer->train(inputs, targets, 3, 10, 0.01);
+        }
+    });
+
+    double output = 0.0;
+    for (int step = 0; step < 10000; ++step) {
+        output = buffer->predict(input);
+        EXPECT_TRUE(std::isfinite(output));
+    }
+    trainer.join();
+
+    RBFModel rbf(n_centers, input_dim, 1.0, false);
+    rbf.train(inputs, targets, 3, 500, 0.01);
+    EXPECT_NEAR(buffer->predict(input), rbf.predict(input), 1e-12);
+}
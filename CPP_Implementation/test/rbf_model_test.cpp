@@ -75,3 +75,12 @@ TEST_F(RBFModelTest, Train_Function) {
         EXPECT_NE(rbf->get_weight(i), 0.0);
     }
 }
+
+// Test setting centers
+TEST_F(RBFModelTest, Set_Center) {
+    double center[] = {1.0, 2.0, 3.0};
+    rbf->set_center(0, center);
+    rbf->set_weight(0, 1.0);
+
+    EXPECT_NEAR(rbf->predict(center), 1.0, 1e-12);
+}
@@ -1,5 +1,14 @@
+import copy
+import itertools
+import multiprocessing
+import queue
+import threading
+
 import numpy as np
 
+# Elements of the batched distances per chunk when compiling a lookup table
+LUT_CHUNK_SIZE = 2 ** 20
+
 class RBFNetwork:
     """ Basic radial basis function (RBF) neural network class, numpy implementation. 
 
@@ -23,6 +32,10 @@ class RBFNetwork:
         Predicts from the model using the gaussian and saved weights.
     train(x, target):
         Train the RBF model on stored data. 
+    copy():
+        Copy the network into an independent instance.
+    compile_lut(bounds, resolution):
+        Sample the network onto a grid for interpolated lookups.
     """
     def __init__(self, input_dim, n_centers):
         """ Constructs distribution parameters and initializes weights.
@@ -63,12 +76,15 @@ class RBFNetwork:
         Parameters
         ----------
             x : ndarray[Any, dtype[float64]]
-                The point in space to evaluate the Gaussian.
+                The point in space to evaluate the Gaussian, or one point per row.
 
         Returns
         -------
-        Approximation of the target function. 
+        Approximation of the target function, one per point for batched input. 
         """
+        if np.ndim(x) == 2:
+            distances = np.sum((np.asarray(x)[:, np.newaxis, :] - self.centers) ** 2, axis=2)
+            return np.exp(-distances / (2 * self.sigma ** 2)) @ self.weights
         activations = np.array([self.gaussian(x, center) for center in self.centers])
         return np.dot(activations, self.weights)
 
@@ -83,4 +99,286 @@ class RBFNetwork:
                 Target data point.
         """
         activations = np.array([self.gaussian(x, center) for center in self.centers])
-        self.weights += 0.01 * (target - np.dot(activations, self.weights)) * activations
\ No newline at end of file
+        self.weights += 0.01 * (target - np.dot(activations, self.weights)) * activations
+
+    def copy(self):
+        """ Copy the network into an independent instance with its own centers
+        and weights.
+
+        Returns
+        -------
+        New RBFNetwork with the same parameters.
+        """
+        return copy.deepcopy(self)
+
+    def compile_lut(self, bounds, resolution=32):
+        """ Sample the network onto a regular grid for constant time, exp-free
+        lookups with multilinear (trilinear for 3 inputs) interpolation.
+
+        The reported error bound holds for inputs inside the bounds. It uses
+        |d2/dx2 exp(-x^2 / (2 sigma^2))| <= 1 / sigma^2 along each axis, giving
+        sum(|weights|) / sigma^2 * sum(step^2) / 8.
+
+        Parameters
+        ----------
+            bounds : array_like
+                Lower and upper bound of each input, shape (input_dim, 2).
+                Upper bounds must be greater than lower bounds.
+            resolution : int or array_like
+                Grid points per input, at least 2.
+
+        Returns
+        -------
+        RBFLookupTable of the network.
+        """
+        bounds = np.asarray(bounds, dtype=np.float64).reshape(self.input_dim, 2)
+        resolution = np.broadcast_to(np.asarray(resolution, dtype=int), (self.input_dim,))
+        if np.any(resolution < 2):
+            raise ValueError("resolution must be at least 2 points per input")
+        if np.any(bounds[:, 1] <= bounds[:, 0]):
+            raise ValueError("upper bounds must be greater than lower bounds")
+
+        # Evaluate the grid in chunks so the batched distances stay near LUT_CHUNK_SIZE elements
+        axes = [np.linspace(low, high, n) for (low, high), n in zip(bounds, resolution)]
+        values = np.empty(int(np.prod(resolution)))
+        chunk = max(1, LUT_CHUNK_SIZE // (self.n_centers * self.input_dim))
+        for start in range(0, len(values), chunk):
+            index = np.unravel_index(np.arange(start, min(start + chunk, len(values))), tuple(resolution))
+            values[start:start + chunk] = self.predict(np.stack([axis[i] for axis, i in zip(axes, index)], axis=-1))
+
+        step = (bounds[:, 1] - bounds[:, 0]) / (resolution - 1)
+        error_bound = np.sum(np.abs(self.weights)) / self.sigma ** 2 * np.sum(step ** 2) / 8
+        return RBFLookupTable(values.reshape(tuple(resolution)), bounds, error_bound)
+
+
+class RBFLookupTable:
+    """ Lookup table of a trained RBF network with multilinear interpolation.
+
+    Each prediction reads the 2^input_dim surrounding grid points, so the cost
+    is independent of the number of centers and needs no exp calls. Inputs 
+    outside the bounds are clamped to the edge of the grid. Can be passed to 
+    AdaptivePIDNP in place of an RBFNetwork.
+
+    ...
+
+    Attributes
+    ----------
+    values : ndarray[Any, dtype[float64]]
+        Network output at each grid point.
+    bounds : ndarray[Any, dtype[float64]]
+        Lower and upper bound of each input, shape (input_dim, 2).
+    error_bound : float64
+        Maximum interpolation error inside the bounds.
+
+    Methods
+    -------
+    predict(x):
+        Interpolates the network output at x.
+    """
+    def __init__(self, values, bounds, error_bound):
+        """ Constructs the grid and its spacing.
+
+        Parameters
+        ----------
+            values : ndarray[Any, dtype[float64]]
+                Network output at each grid point.
+            bounds : ndarray[Any, dtype[float64]]
+                Lower and upper bound of each input, shape (input_dim, 2).
+            error_bound : float64
+                Maximum interpolation error inside the bounds.
+        """
+        self.values = np.ascontiguousarray(values)
+        self.bounds = bounds
+        self.error_bound = error_bound
+        self._shape = np.array(self.values.shape)
+        self._step = (bounds[:, 1] - bounds[:, 0]) / (self._shape - 1)
+        self._corners = np.array(list(itertools.product((0, 1), repeat=values.ndim)))
+        self._strides = np.array(self.values.strides) // self.values.itemsize
+        self._offsets = self._corners @ self._strides
+        self._flat = self.values.ravel()
+        self._axes = list(zip(bounds[:, 0].tolist(), bounds[:, 1].tolist(), self._step.tolist(),
+                              (self._shape - 2).tolist(), self._strides.tolist()))
+        self._corner_offsets = list(zip(self._corners.tolist(), self._offsets.tolist()))
+
+    def predict(self, x):
+        """ Interpolate the network output.
+
+        Parameters
+        ----------
+            x : ndarray[Any, dtype[float64]]
+                One point, or one point per row.
+
+        Returns
+        -------
+        Approximation of the network output, one per point for batched input.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        if x.shape[-1] != self.values.ndim:
+            raise ValueError(f"expected {self.values.ndim} inputs per point, got {x.shape[-1]}")
+        if x.ndim == 1:
+            return self._predict_point(x.tolist())
+
+        position = (np.clip(x, self.bounds[:, 0], self.bounds[:, 1]) - self.bounds[:, 0]) / self._step
+        index = np.minimum(position.astype(int), self._shape - 2)
+        fraction = position - index
+
+        weights = np.prod(np.where(self._corners, fraction[:, np.newaxis, :], 
+                                   1 - fraction[:, np.newaxis, :]), axis=2)
+        corners = (index @ self._strides)[:, np.newaxis] + self._offsets
+        return np.sum(weights * self._flat[corners], axis=1)
+
+    def _predict_point(self, x):
+        """ Interpolate one point with scalar math, cheaper than array calls for a 
+        single lookup. """
+        base = 0
+        fractions = []
+        for value, (low, high, step, max_index, stride) in zip(x, self._axes):
+            position = (min(max(value, low), high) - low) / step
+            index = min(int(position), max_index)
+            fractions.append(position - index)
+            base += index * stride
+
+        output = 0.0
+        for corner, offset in self._corner_offsets:
+            weight = 1.0
+            for bit, fraction in zip(corner, fractions):
+                weight *= fraction if bit else 1.0 - fraction
+            output += weight * self._flat[base + offset]
+        return output
+
+
+class RBFNetworkBuffer:
+    """ Double-buffered RBF network holder for training alongside a live controller.
+
+    The controller predicts from the published front network while a worker
+    process trains its own copy, so training does not hold the GIL of the
+    control loop. A receiving thread swaps in each trained snapshot with a
+    single reference assignment, so predictions never see half-updated weights.
+    Receiving a snapshot takes the GIL briefly to unpickle it, which can delay
+    a prediction by up to the interpreter switch interval. Can be passed to
+    AdaptivePIDNP in place of an RBFNetwork.
+
+    ...
+
+    Attributes
+    ----------
+    front : RBFNetwork
+        Published network used for predictions. Never modified after publishing.
+
+    Methods
+    -------
+    predict(x):
+        Predicts from the published network.
+    publish(network):
+        Publishes a snapshot of the network.
+    submit(x, targets):
+        Queues training data for the worker process.
+    start():
+        Starts the worker process.
+    stop():
+        Stops the worker process.
+    """
+    def __init__(self, rbf_network):
+        """ Constructs the front snapshot and the training queues.
+
+        Parameters
+        ----------
+            rbf_network : RBFNetwork
+                Initial network. Copied to the worker process, not modified.
+        """
+        self.front = rbf_network.copy()
+        self._working = rbf_network
+        self._context = multiprocessing.get_context("spawn")
+        self._batches = self._context.Queue()
+        self._results = self._context.Queue()
+        self._process = None
+        self._receiver = None
+
+    def predict(self, x):
+        """ Prediction function using the published network.
+
+        Parameters
+        ----------
+            x : ndarray[Any, dtype[float64]]
+                The point in space to evaluate the Gaussian, or one point per row.
+
+        Returns
+        -------
+        Approximation of the target function, one per point for batched input. 
+        """
+        return self.front.predict(x)
+
+    def publish(self, network):
+        """ Publish a snapshot of the network, picked up by the next prediction.
+
+        Parameters
+        ----------
+            network : RBFNetwork
+                Network to publish.
+        """
+        self.front = network.copy()
+
+    def submit(self, x, targets):
+        """ Queue training data for the worker process. Each batch is trained
+        once and then published. Does not wait for the worker.
+
+        Parameters
+        ----------
+            x : ndarray[Any, dtype[float64]]
+                Training inputs, one row per sample.
+            targets : ndarray[Any, dtype[float64]]
+                Target data points, one per sample.
+        """
+        self._batches.put((np.array(x), np.array(targets)))
+
+    def start(self):
+        """ Start the worker process, from the last published network, if it
+        is not running. """
+        if self._process is not None and self._process.is_alive():
+            return
+        self._process = self._context.Process(target=_train_worker, args=(self._working, self._batches, self._results),
+                                              daemon=True)
+        self._process.start()
+        self._receiver = threading.Thread(target=self._receive_loop, daemon=True)
+        self._receiver.start()
+
+    def stop(self):
+        """ Stop the worker process after queued data is trained and published. """
+        if self._process is None:
+            return
+        self._batches.put(None)
+        self._receiver.join()
+        self._process.join()
+        self._process = None
+        self._receiver = None
+
+    def _receive_loop(self):
+        """ Publish the networks trained by the worker process. Waiting on the
+        queue releases the GIL. """
+        while True:
+            try:
+                network = self._results.get(timeout=0.1)
+            except queue.Empty:
+                if self._process.is_alive():
+                    continue
+                break       # the worker died without sending None
+            if network is None:
+                break
+            self.front = network
+            self._working = network
+
+
+def _train_worker(network, batches, results):
+    """ Train the network on queued batches in the worker process and send a
+    snapshot after each. Sends None when done. """
+    try:
+        while True:
+            batch = batches.get()
+            if batch is None:
+                break
+            x, targets = batch
+            for sample, target in zip(x, targets):
+                network.train(sample, target)
+            results.put(network.copy())
+    finally:
+        results.put(None)
@@ -1,8 +1,15 @@
 import numpy as np
 
-class AdaptivePIDNP:
+from pid_core import PIDCore
+
+class AdaptivePIDNP(PIDCore):
     """ PID class implemented for numpy integration. 
 
+    Uses the shared PIDCore for the PID terms, so setpoint weighting, derivative
+    filtering, output saturation, and anti-windup are available as keyword
+    arguments. Runs many loops at once when given arrays, with one batched
+    network prediction per update.
+
     ...
 
     Attributes
@@ -13,15 +20,20 @@ class AdaptivePIDNP:
         Integral gain.
     Kd : float64
         Derivative gain.
-    rbf_network : RBFNetwork object
-        RBF network class instance.
+    rbf_network : RBFNetwork, RBFNetworkBuffer or RBFLookupTable object
+        RBF network class instance. A buffer picks up newly published
+        networks at the next update.
 
     Methods
     -------
     update(target, measured_value, dt):
         Updates the control signal.    
+    set_gains(Kp, Ki, Kd):
+        Changes gains without a bump in the adapted output.
+    bumpless_transfer(u, target, measured_value):
+        Initializes the state so the next adapted output continues from u.
     """
-    def __init__(self, Kp, Ki, Kd, rbf_network):
+    def __init__(self, Kp, Ki, Kd, rbf_network, **kwargs):
         """ Constructs PID gains and RBF network.
 
         Parameters
@@ -32,17 +44,13 @@ class AdaptivePIDNP:
                 Integral gain.
             Kd : float64
                 Derivative gain.
-            rbf_network : RBFNetwork object
+            rbf_network : RBFNetwork, RBFNetworkBuffer or RBFLookupTable object
                 RBF network class instance.
+            **kwargs
+                Setpoint weights, derivative filter, and output limits, see PIDCore.
         """
-        self.Kp = Kp
-        self.Ki = Ki
-        self.Kd = Kd
+        super().__init__(Kp, Ki, Kd, **kwargs)
         self.rbf_network = rbf_network
-        self.prev_err = 0
-        self.error = 0
-        self.integral = 0
-        self.derivative = 0
 
     def update(self, target, measured_value, dt):
         """ Update the control signal according to error and adapt with RBF
@@ -61,15 +69,40 @@ class AdaptivePIDNP:
         -------
         Control signal.
         """
-        self.error = target - measured_value
-        self.integral += self.error * dt
-        self.derivative = (self.error - self.prev_err) / dt
+        return super().update(target, measured_value, dt, self._adapt)
+
+    def set_gains(self, Kp, Ki, Kd):
+        """ Change gains without a bump in the output, including the RBF network prediction.
+
+        Parameters
+        ----------
+            Kp : float64
+                Proportional gain.
+            Ki : float64
+                Integral gain.
+            Kd : float64
+                Derivative gain.
+        """
+        super().set_gains(Kp, Ki, Kd, self._adapt)
 
-        u = (self.Kp * self.error) + (self.Ki * self.integral) + (self.Kd*self.derivative)
+    def bumpless_transfer(self, u, target, measured_value):
+        """ Initialize the state so the next output continues from u, including
+        the RBF network prediction.
 
-        gain_adapt = self.rbf_network.predict(np.array([self.error, self.integral, self.derivative]))
-        u += gain_adapt
+        Parameters
+        ----------
+            u : float64
+                Control signal currently applied.
+            target : float64
+                Target setpoint.
+            measured_value : float64
+                Actual value.
+        """
+        super().bumpless_transfer(u, target, measured_value, self._adapt)
 
-        self.prev_err = self.error
-        return u
-        
\ No newline at end of file
+    def _adapt(self, error, integral, derivative):
+        """ RBF network prediction from the PID terms, one batched call for all loops. """
+        x = np.stack(np.broadcast_arrays(error, integral, derivative), axis=-1)
+        if x.ndim == 1:
+            return self.rbf_network.predict(x)
+        return self.rbf_network.predict(x.reshape(-1, 3)).reshape(x.shape[:-1])
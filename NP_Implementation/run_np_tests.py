@@ -1,9 +1,16 @@
+import os
+import sys
 import unittest
 
-loader = unittest.TestLoader()
-suite = unittest.TestSuite()
+# The controllers import pid_core from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-suite.addTests(loader.discover(start_dir='test', pattern='*.py'))
+# Guarded so the spawned training processes can import this script
+if __name__ == '__main__':
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
 
-runner = unittest.TextTestRunner()
-runner.run(suite)
\ No newline at end of file
+    suite.addTests(loader.discover(start_dir='test', pattern='*.py'))
+
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
@@ -1,7 +1,8 @@
 import unittest
+from unittest import mock
 import numpy as np
 
-from RBF_numpy import RBFNetwork
+from RBF_numpy import RBFNetwork, RBFNetworkBuffer, RBFLookupTable
 
 class TestRBFNetwork(unittest.TestCase):
     def setUp(self):
@@ -50,5 +51,136 @@ class TestRBFNetwork(unittest.TestCase):
         if not abs(target - output_after) < abs(target - output_before):
             print("Output did not move closer to the target after training.")
 
+    def test_predict_batch(self):
+        """Test batched prediction matches single points."""
+        x = np.random.rand(4, self.input_dim)
+        output = self.rbf_network.predict(x)
+
+        self.assertEqual(output.shape, (4,))
+        for i in range(4):
+            self.assertAlmostEqual(output[i], self.rbf_network.predict(x[i]))
+
+    def test_copy(self):
+        """Test the copy is independent of the original."""
+        network = self.rbf_network.copy()
+        np.testing.assert_array_equal(network.centers, self.rbf_network.centers)
+        np.testing.assert_array_equal(network.weights, self.rbf_network.weights)
+
+        network.train(self.x, 1.0)
+        self.assertFalse(np.array_equal(network.weights, self.rbf_network.weights))
+
+class TestRBFNetworkBuffer(unittest.TestCase):
+    def setUp(self):
+        """Set up an RBFNetworkBuffer instance for testing."""
+        self.input_dim = 3
+        self.n_centers = 5
+        self.x = np.array([0.5, 0.5, 0.2])
+        self.rbf_network = RBFNetwork(self.input_dim, self.n_centers)
+        self.buffer = RBFNetworkBuffer(self.rbf_network)
+
+    def test_predict(self):
+        """Test the buffer predicts from the published network."""
+        self.assertAlmostEqual(self.buffer.predict(self.x), self.rbf_network.predict(self.x))
+
+    def test_publish(self):
+        """Test publishing a network swaps in a snapshot."""
+        network = self.rbf_network.copy()
+        network.weights += 1.0
+        self.buffer.publish(network)
+        self.assertAlmostEqual(self.buffer.predict(self.x), network.predict(self.x))
+
+        network.weights += 1.0
+        self.assertNotAlmostEqual(self.buffer.predict(self.x), network.predict(self.x))
+
+    def test_background_training(self):
+        """Test background training publishes without touching the front in between."""
+        front = self.buffer.front
+        front_weights = front.weights.copy()
+        output_before = self.buffer.predict(self.x)
+
+        self.buffer.start()
+        self.buffer.submit(np.tile(self.x, (50, 1)), np.full(50, 1.0))
+        self.buffer.stop()
+
+        np.testing.assert_array_equal(front.weights, front_weights)
+        np.testing.assert_array_equal(self.rbf_network.weights, front_weights)
+        self.assertIsNot(self.buffer.front, front)
+        output_after = self.buffer.predict(self.x)
+        self.assertLess(abs(1.0 - output_after), abs(1.0 - output_before))
+
+    def test_restart(self):
+        """Test a restarted worker continues from the last published network."""
+        self.buffer.start()
+        self.buffer.submit(np.tile(self.x, (50, 1)), np.full(50, 1.0))
+        self.buffer.stop()
+        output_first = self.buffer.predict(self.x)
+
+        self.buffer.submit(np.tile(self.x, (50, 1)), np.full(50, 1.0))
+        self.buffer.start()
+        self.buffer.stop()
+        self.assertLess(abs(1.0 - self.buffer.predict(self.x)), abs(1.0 - output_first))
+
+class TestRBFLookupTable(unittest.TestCase):
+    def setUp(self):
+        """Set up an RBFNetwork and its lookup table for testing."""
+        self.input_dim = 3
+        self.n_centers = 5
+        self.bounds = [[-1.0, 2.0], [-1.0, 2.0], [-1.0, 2.0]]
+        self.rbf_network = RBFNetwork(self.input_dim, self.n_centers)
+        self.lut = self.rbf_network.compile_lut(self.bounds, resolution=16)
+
+    def test_compile(self):
+        """Test the compiled grid shape and grid point values."""
+        self.assertIsInstance(self.lut, RBFLookupTable)
+        self.assertEqual(self.lut.values.shape, (16, 16, 16))
+        self.assertAlmostEqual(self.lut.values[0, 0, 0], self.rbf_network.predict(np.array([-1.0, -1.0, -1.0])))
+        self.assertAlmostEqual(self.lut.predict(np.array([2.0, 2.0, 2.0])), 
+                               self.rbf_network.predict(np.array([2.0, 2.0, 2.0])))
+
+    def test_compile_chunks(self):
+        """Test compiling in chunks gives the same grid as the full batch."""
+        with mock.patch("RBF_numpy.LUT_CHUNK_SIZE", 7 * self.n_centers * self.input_dim):
+            lut = self.rbf_network.compile_lut(self.bounds, resolution=(16, 5, 3))
+
+        axes = [np.linspace(-1.0, 2.0, n) for n in (16, 5, 3)]
+        grid = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, self.input_dim)
+        np.testing.assert_allclose(lut.values.ravel(), self.rbf_network.predict(grid))
+
+    def test_predict_within_error_bound(self):
+        """Test interpolated outputs stay within the reported error bound."""
+        points = np.random.uniform(-1.0, 2.0, size=(200, self.input_dim))
+        expected = np.array([self.rbf_network.predict(point) for point in points])
+        output = self.lut.predict(points)
+
+        self.assertEqual(output.shape, (200,))
+        self.assertLessEqual(np.max(np.abs(output - expected)), self.lut.error_bound)
+        self.assertIsInstance(self.lut.predict(points[0]), float)
+
+    def test_resolution(self):
+        """Test finer grids give smaller error bounds and bad resolutions fail."""
+        lut_fine = self.rbf_network.compile_lut(self.bounds, resolution=(32, 32, 32))
+        self.assertLess(lut_fine.error_bound, self.lut.error_bound)
+        with self.assertRaises(ValueError):
+            self.rbf_network.compile_lut(self.bounds, resolution=1)
+
+    def test_invalid_bounds(self):
+        """Test inverted and zero width bounds are rejected."""
+        with self.assertRaises(ValueError):
+            self.rbf_network.compile_lut([[2.0, -1.0], [-1.0, 2.0], [-1.0, 2.0]])
+        with self.assertRaises(ValueError):
+            self.rbf_network.compile_lut([[1.0, 1.0], [-1.0, 2.0], [-1.0, 2.0]])
+
+    def test_input_length(self):
+        """Test inputs of the wrong length are rejected."""
+        with self.assertRaises(ValueError):
+            self.lut.predict(np.zeros(2))
+        with self.assertRaises(ValueError):
+            self.lut.predict(np.zeros((4, 2)))
+
+    def test_clamp(self):
+        """Test inputs outside the bounds are clamped to the grid edge."""
+        self.assertAlmostEqual(self.lut.predict(np.array([5.0, 5.0, 5.0])), 
+                               self.lut.predict(np.array([2.0, 2.0, 2.0])))
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,7 +2,7 @@ import unittest
 import numpy as np
 
 from aPID_numpy import AdaptivePIDNP
-from RBF_numpy import RBFNetwork
+from RBF_numpy import RBFNetwork, RBFNetworkBuffer
 
 class TestAdaptivePIDNP(unittest.TestCase):
     def setUp(self):
@@ -66,5 +66,144 @@ class TestAdaptivePIDNP(unittest.TestCase):
         self.assertNotEqual(initial_control_signal, adjusted_control_signal)
         self.assertLess(self.target-measured_value, self.target-self.measured_value)
 
+    def test_buffer_hot_swap(self):
+        """Test a published network is used at the next update."""
+        buffer = RBFNetworkBuffer(self.rbf)
+        apid = AdaptivePIDNP(4.0, 0.1, 0.01, buffer)
+        control_signal = apid.update(1.0, 0.9, 1.0)
+
+        network = self.rbf.copy()
+        network.weights += 1.0
+        buffer.publish(network)
+        apid.prev_err, apid.integral = 0, 0
+        control_signal_swapped = apid.update(1.0, 0.9, 1.0)
+
+        self.assertGreater(control_signal_swapped, control_signal)
+
+    def test_lookup_table(self):
+        """Test a lookup table adapts the control signal like its network."""
+        lut = self.rbf.compile_lut([[-5.0, 5.0], [-5.0, 5.0], [-5.0, 5.0]], resolution=64)
+        apid_lut = AdaptivePIDNP(4.0, 0.1, 0.01, lut)
+        control_signal = self.apid.update(1.0, 0.9, 1.0)
+        control_signal_lut = apid_lut.update(1.0, 0.9, 1.0)
+
+        self.assertAlmostEqual(control_signal, control_signal_lut, delta=lut.error_bound)
+
+class TestPIDCore(unittest.TestCase):
+    def setUp(self):
+        """Set up an RBFNetwork with zero weights so only the PID terms act."""
+        self.rbf = RBFNetwork(3, 5)
+        self.rbf.weights = np.zeros(5)
+        self.dt = 0.1
+
+    def test_saturation(self):
+        """Test the output is clamped to its limits."""
+        apid = AdaptivePIDNP(4.0, 0.1, 0.01, self.rbf, u_min=-1.0, u_max=1.0)
+        self.assertEqual(apid.update(10.0, 0.0, self.dt), 1.0)
+        self.assertEqual(apid.update(-10.0, 0.0, self.dt), -1.0)
+
+    def test_anti_windup(self):
+        """Test the integral is held while saturated and recovers quickly."""
+        apid = AdaptivePIDNP(1.0, 1.0, 0.0, self.rbf, u_max=1.0)
+        unlimited = AdaptivePIDNP(1.0, 1.0, 0.0, self.rbf)
+        for _ in range(50):
+            apid.update(10.0, 0.0, self.dt)
+            unlimited.update(10.0, 0.0, self.dt)
+
+        self.assertEqual(apid.integral, 0.0)
+        self.assertGreater(unlimited.integral, 40.0)
+        self.assertLess(apid.update(0.0, 1.0, self.dt), 0.0)
+
+    def test_reverse_acting_anti_windup(self):
+        """Test anti-windup follows the sign of the integral term with negative gains."""
+        apid = AdaptivePIDNP(-1.0, -1.0, 0.0, self.rbf, u_max=1.0)
+        for _ in range(50):
+            self.assertEqual(apid.update(0.0, 10.0, self.dt), 1.0)
+
+        self.assertEqual(apid.integral, 0.0)
+        self.assertLess(apid.update(0.0, -1.0, self.dt), 0.0)
+
+    def test_derivative_filter(self):
+        """Test the derivative filter smooths a step in the error."""
+        apid = AdaptivePIDNP(0.0, 0.0, 1.0, self.rbf, Tf=0.4)
+        apid.update(1.0, 1.0, self.dt)
+        apid.update(1.0, 0.0, self.dt)
+
+        self.assertAlmostEqual(apid.derivative, 0.2 * 1.0 / self.dt)
+
+    def test_setpoint_weighting(self):
+        """Test setpoint weights scale the setpoint in the P and D terms."""
+        apid = AdaptivePIDNP(2.0, 0.0, 1.0, self.rbf, b=0.5, c=0.0)
+        control_signal = apid.update(4.0, 1.0, self.dt)
+
+        self.assertAlmostEqual(apid.error, 3.0)
+        self.assertAlmostEqual(control_signal, 2.0 * (0.5 * 4.0 - 1.0) + (-1.0 / self.dt))
+
+    def test_zero_dt(self):
+        """Test a non positive timestep holds the integral and derivative."""
+        apid = AdaptivePIDNP(1.0, 1.0, 1.0, self.rbf)
+        apid.update(1.0, 0.0, self.dt)
+        integral, derivative = apid.integral, apid.derivative
+
+        control_signal = apid.update(1.0, 0.5, 0.0)
+        self.assertTrue(np.isfinite(control_signal))
+        self.assertEqual(apid.integral, integral)
+        self.assertEqual(apid.derivative, derivative)
+
+    def test_bumpless(self):
+        """Test bumpless transfer and gain changes keep the output continuous."""
+        apid = AdaptivePIDNP(2.0, 0.5, 0.1, self.rbf)
+        apid.bumpless_transfer(3.0, 1.0, 0.5)
+        self.assertAlmostEqual(apid.update(1.0, 0.5, 0.0), 3.0)
+
+        apid.update(1.0, 0.5, self.dt)
+        control_signal = apid.update(1.0, 0.5, 0.0)
+        apid.set_gains(4.0, 1.0, 0.3)
+        self.assertAlmostEqual(apid.update(1.0, 0.5, 0.0), control_signal)
+
+    def test_bumpless_adaptive(self):
+        """Test bumpless transfer and gain changes account for the RBF adaptation."""
+        np.random.seed(0)
+        apid = AdaptivePIDNP(2.0, 0.5, 0.1, RBFNetwork(3, 5))
+        apid.bumpless_transfer(1.25, 1.0, 0.5)
+        self.assertNotAlmostEqual(apid.Kp * 0.5 + apid.Ki * apid.integral, 1.25)
+        self.assertAlmostEqual(apid.update(1.0, 0.5, 0.0), 1.25)
+
+        apid.update(1.0, 0.5, self.dt)
+        control_signal = apid.update(1.0, 0.5, 0.0)
+        apid.set_gains(4.0, 1.0, 0.3)
+        self.assertAlmostEqual(apid.update(1.0, 0.5, 0.0), control_signal)
+
+        targets = np.array([1.0, 0.8])
+        measured = np.array([0.5, 0.6])
+        apid.bumpless_transfer(np.array([1.25, -0.5]), targets, measured)
+        np.testing.assert_allclose(apid.update(targets, measured, 0.0), [1.25, -0.5])
+
+    def test_vectorized(self):
+        """Test many loops run at once and match single loops."""
+        targets = np.array([1.0, 2.0, -1.0])
+        measured = np.array([0.0, 0.5, 0.0])
+        apid = AdaptivePIDNP(np.array([4.0, 2.0, 1.0]), 0.1, 0.01, self.rbf, u_max=5.0)
+        control_signals = apid.update(targets, measured, self.dt)
+
+        self.assertEqual(control_signals.shape, (3,))
+        for i, Kp in enumerate([4.0, 2.0, 1.0]):
+            single = AdaptivePIDNP(Kp, 0.1, 0.01, self.rbf, u_max=5.0)
+            self.assertAlmostEqual(control_signals[i], single.update(targets[i], measured[i], self.dt))
+
+    def test_vectorized_adaptation(self):
+        """Test many loops share one batched prediction that matches single loops."""
+        rbf = RBFNetwork(3, 5)
+        lut = rbf.compile_lut([[-3.0, 3.0], [-3.0, 3.0], [-3.0, 3.0]], resolution=8)
+        targets = np.array([1.0, 0.5])
+        measured = np.array([0.8, 0.6])
+
+        for network in (rbf, RBFNetworkBuffer(rbf), lut):
+            apid = AdaptivePIDNP(4.0, 0.1, 0.01, network)
+            control_signals = apid.update(targets, measured, 1.0)
+            for i in range(2):
+                single = AdaptivePIDNP(4.0, 0.1, 0.01, network)
+                self.assertAlmostEqual(control_signals[i], single.update(targets[i], measured[i], 1.0))
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,9 @@
+import itertools
+import multiprocessing
+import queue
+import threading
+
+import numpy as np
 import tensorflow as tf
 
 class RBFLayer(tf.keras.layers.Layer):
@@ -104,7 +110,7 @@ class RBFAdaptiveModel(tf.keras.Model):
         control_signal = self.output_layer(rbf_output)
         return control_signal
 
-def train_rbf_adaptive(model, errors, control_signals, epochs=100):
+def train_rbf_adaptive(model, errors, control_signals, epochs=100, verbose=1):
     """ Training method for the RBF adaptive model.
 
     Parameters
@@ -117,6 +123,286 @@ def train_rbf_adaptive(model, errors, control_signals, epochs=100):
             Control signal target values.
         epochs : int
             Number of epochs to train for.
+        verbose : int
+            Keras verbosity mode.
     """
     model.compile(optimizer="adam", loss="mean_squared_error")
-    model.fit(errors, control_signals, epochs=epochs, verbose=1)
+    model.fit(errors, control_signals, epochs=epochs, verbose=verbose)
+
+def clone_rbf_adaptive(model):
+    """ Copy a RBF adaptive model into an independent instance.
+
+    Parameters
+    ----------
+        model : RBFAdaptiveModel
+            A RBF Adaptive Model instance.
+
+    Returns
+    -------
+    New RBFAdaptiveModel with the same weights.
+    """
+    model(tf.zeros((1, model.rbf_layer.centers.shape[1])))
+    return _rbf_adaptive_from_weights(model.get_weights())
+
+def _rbf_adaptive_from_weights(weights):
+    """ Build a RBF adaptive model with weights as returned by get_weights. """
+    n_centers, input_dim = weights[0].shape
+    model = RBFAdaptiveModel(n_centers, input_dim)
+    model(tf.zeros((1, input_dim)))
+    model.set_weights(weights)
+    return model
+
+def compile_rbf_lut(model, bounds, resolution=32):
+    """ Sample a RBF adaptive model onto a regular grid for constant time, exp-free
+    lookups with multilinear (trilinear for 3 inputs) interpolation.
+
+    The reported error bound holds for inputs inside the bounds. It uses
+    |d2/dx2 exp(-x^2 / (2 sigma^2))| <= 1 / sigma^2 along each axis, giving
+    sum(|kernel| / sigmas^2) * sum(step^2) / 8.
+
+    Parameters
+    ----------
+        model : RBFAdaptiveModel
+            A RBF Adaptive Model instance.
+        bounds : array_like
+            Lower and upper bound of each input, shape (input_dim, 2).
+            Upper bounds must be greater than lower bounds.
+        resolution : int or array_like
+            Grid points per input, at least 2.
+
+    Returns
+    -------
+    RBFLookupTable of the model.
+    """
+    input_dim = model.rbf_layer.centers.shape[1]
+    bounds = np.asarray(bounds, dtype=np.float64).reshape(input_dim, 2)
+    resolution = np.broadcast_to(np.asarray(resolution, dtype=int), (input_dim,))
+    if np.any(resolution < 2):
+        raise ValueError("resolution must be at least 2 points per input")
+    if np.any(bounds[:, 1] <= bounds[:, 0]):
+        raise ValueError("upper bounds must be greater than lower bounds")
+
+    axes = [np.linspace(low, high, n) for (low, high), n in zip(bounds, resolution)]
+    grid = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, input_dim)
+    values = model.predict(grid, batch_size=4096, verbose=0).reshape(tuple(resolution))
+
+    kernel = model.output_layer.kernel.numpy()[:, 0]
+    sigmas = model.rbf_layer.sigmas.numpy()
+    step = (bounds[:, 1] - bounds[:, 0]) / (resolution - 1)
+    error_bound = np.sum(np.abs(kernel) / np.square(sigmas)) * np.sum(step ** 2) / 8
+    return RBFLookupTable(values.astype(np.float64), bounds, error_bound)
+
+
+class RBFLookupTable:
+    """ Lookup table of a trained RBF adaptive model with multilinear interpolation.
+
+    Each lookup reads the 2^input_dim surrounding grid points, so the cost
+    is independent of the number of centers and needs no exp calls. Inputs 
+    outside the bounds are clamped to the edge of the grid. Can be passed to 
+    AdaptivePIDTf in place of a RBFAdaptiveModel.
+
+    ...
+
+    Attributes
+    ----------
+    values : ndarray
+        Model output at each grid point.
+    bounds : ndarray
+        Lower and upper bound of each input, shape (input_dim, 2).
+    error_bound : float
+        Maximum interpolation error inside the bounds.
+
+    Methods
+    -------
+    __call__(inputs):
+        Interpolates the model output at inputs.
+    """
+    def __init__(self, values, bounds, error_bound):
+        """ Constructs the grid and its spacing.
+
+        Parameters
+        ----------
+            values : ndarray
+                Model output at each grid point.
+            bounds : ndarray
+                Lower and upper bound of each input, shape (input_dim, 2).
+            error_bound : float
+                Maximum interpolation error inside the bounds.
+        """
+        self.values = np.ascontiguousarray(values)
+        self.bounds = bounds
+        self.error_bound = error_bound
+        self._shape = np.array(self.values.shape)
+        self._step = (bounds[:, 1] - bounds[:, 0]) / (self._shape - 1)
+        self._corners = np.array(list(itertools.product((0, 1), repeat=self.values.ndim)))
+        self._strides = np.array(self.values.strides) // self.values.itemsize
+        self._offsets = self._corners @ self._strides
+
+    def __call__(self, inputs):
+        """ Interpolate the model output.
+
+        Parameters
+        ----------
+            inputs : tensor
+                The points in space to adapt with, one per row.
+
+        Returns
+        -------
+        Adapted control signal, shape (batch, 1) like RBFAdaptiveModel.
+        """
+        points = np.asarray(inputs, dtype=np.float64)
+        if points.shape[-1] != self.values.ndim:
+            raise ValueError(f"expected {self.values.ndim} inputs per point, got {points.shape[-1]}")
+        points = points.reshape(-1, self.values.ndim)
+        position = (np.clip(points, self.bounds[:, 0], self.bounds[:, 1]) - self.bounds[:, 0]) / self._step
+        index = np.minimum(position.astype(int), self._shape - 2)
+        fraction = position - index
+
+        weights = np.prod(np.where(self._corners, fraction[:, np.newaxis, :], 
+                                   1 - fraction[:, np.newaxis, :]), axis=2)
+        corners = (index @ self._strides)[:, np.newaxis] + self._offsets
+        output = np.sum(weights * self.values.ravel()[corners], axis=1, keepdims=True)
+        return tf.constant(output, dtype=tf.float32)
+
+
+class RBFModelBuffer:
+    """ Double-buffered RBF adaptive model holder for training alongside a live
+    controller.
+
+    The controller calls the published front model while a worker process
+    trains its own copy, so training does not hold the GIL of the control
+    loop. A receiving thread rebuilds each trained model from its weights and
+    swaps it in with a single reference assignment, so the controller never
+    sees half-updated weights. Rebuilding holds the GIL for tens of
+    milliseconds per publish, which can delay a forward pass by up to the
+    interpreter switch interval. Can be passed to AdaptivePIDTf in place of a
+    RBFAdaptiveModel.
+
+    ...
+
+    Attributes
+    ----------
+    front : RBFAdaptiveModel
+        Published model used for predictions. Never modified after publishing.
+
+    Methods
+    -------
+    __call__(inputs):
+        Forward pass of the published model.
+    publish(model):
+        Publishes a clone of the model.
+    submit(errors, control_signals, epochs):
+        Queues training data for the worker process.
+    start():
+        Starts the worker process.
+    stop():
+        Stops the worker process.
+    """
+    def __init__(self, model):
+        """ Constructs the front clone and the training queues.
+
+        Parameters
+        ----------
+            model : RBFAdaptiveModel
+                Initial model. Its weights are copied to the worker process,
+                it is not modified.
+        """
+        self.front = clone_rbf_adaptive(model)
+        self._weights = self.front.get_weights()
+        self._context = multiprocessing.get_context("spawn")
+        self._batches = self._context.Queue()
+        self._results = self._context.Queue()
+        self._process = None
+        self._receiver = None
+
+    def __call__(self, inputs):
+        """ Forward pass of the published model.
+
+        Parameters
+        ----------
+            inputs : tensor
+                The points in space to adapt with.
+
+        Returns
+        -------
+        Adapted control signal.
+        """
+        return self.front(inputs)
+
+    def publish(self, model):
+        """ Publish a clone of the model, picked up by the next forward pass.
+
+        Parameters
+        ----------
+            model : RBFAdaptiveModel
+                Model to publish.
+        """
+        self.front = clone_rbf_adaptive(model)
+
+    def submit(self, errors, control_signals, epochs=100):
+        """ Queue training data for the worker process. Each batch is trained
+        with train_rbf_adaptive and then published. Does not wait for the worker.
+
+        Parameters
+        ----------
+            errors : ndarray
+                Multi-sample training data, [error, derivative, integral].
+            control_signals : ndarray
+                Control signal target values.
+            epochs : int
+                Number of epochs to train for.
+        """
+        self._batches.put((np.array(errors), np.array(control_signals), epochs))
+
+    def start(self):
+        """ Start the worker process, from the last published weights, if it
+        is not running. The worker imports TensorFlow, so the first batch
+        waits for it to load. """
+        if self._process is not None and self._process.is_alive():
+            return
+        self._process = self._context.Process(target=_train_worker, args=(self._weights, self._batches, self._results),
+                                              daemon=True)
+        self._process.start()
+        self._receiver = threading.Thread(target=self._receive_loop, daemon=True)
+        self._receiver.start()
+
+    def stop(self):
+        """ Stop the worker process after queued data is trained and published. """
+        if self._process is None:
+            return
+        self._batches.put(None)
+        self._receiver.join()
+        self._process.join()
+        self._process = None
+        self._receiver = None
+
+    def _receive_loop(self):
+        """ Publish the models trained by the worker process. Waiting on the
+        queue releases the GIL. """
+        while True:
+            try:
+                weights = self._results.get(timeout=0.1)
+            except queue.Empty:
+                if self._process.is_alive():
+                    continue
+                break       # the worker died without sending None
+            if weights is None:
+                break
+            self.front = _rbf_adaptive_from_weights(weights)
+            self._weights = weights
+
+
+def _train_worker(weights, batches, results):
+    """ Train a model on queued batches in the worker process and send its
+    weights after each. Sends None when done. """
+    try:
+        model = _rbf_adaptive_from_weights(weights)
+        while True:
+            batch = batches.get()
+            if batch is None:
+                break
+            errors, control_signals, epochs = batch
+            train_rbf_adaptive(model, errors, control_signals, epochs, verbose=0)
+            results.put(model.get_weights())
+    finally:
+        results.put(None)
@@ -1,8 +1,16 @@
+import numpy as np
 import tensorflow as tf
 
-class AdaptivePIDTf:
+from pid_core import PIDCore
+
+class AdaptivePIDTf(PIDCore):
     """ PID class implemented for TensorFlow integration. 
 
+    Uses the shared PIDCore for the PID terms, so setpoint weighting, derivative
+    filtering, output saturation, and anti-windup are available as keyword
+    arguments. Runs many loops at once when given arrays, with one batched
+    model call per update.
+
     ...
 
     Attributes
@@ -13,15 +21,20 @@ class AdaptivePIDTf:
         Integral gain.
     Kd : float
         Derivative gain.
-    rbf_model : RBFAdaptiveModel object
-        RBF adaptive model class instance.
+    rbf_model : RBFAdaptiveModel, RBFModelBuffer or RBFLookupTable object
+        RBF adaptive model class instance. A buffer picks up newly published
+        models at the next update.
 
     Methods
     -------
     update(target, measured_value, dt):
         Updates the control signal.    
+    set_gains(Kp, Ki, Kd):
+        Changes gains without a bump in the adapted output.
+    bumpless_transfer(u, target, measured_value):
+        Initializes the state so the next adapted output continues from u.
     """
-    def __init__(self, Kp, Ki, Kd, rbf_model):
+    def __init__(self, Kp, Ki, Kd, rbf_model, **kwargs):
         """ Constructs PID gains, RBF model, and initial PID components.
 
         Parameters
@@ -32,17 +45,13 @@ class AdaptivePIDTf:
                 Integral gain.
             Kd : float
                 Derivative gain.
-            rbf_model : RBFAdaptiveModel object
+            rbf_model : RBFAdaptiveModel, RBFModelBuffer or RBFLookupTable object
                 RBF adaptive model class instance.
+            **kwargs
+                Setpoint weights, derivative filter, and output limits, see PIDCore.
         """
-        self.Kp = Kp
-        self.Ki = Ki
-        self.Kd = Kd
+        super().__init__(Kp, Ki, Kd, **kwargs)
         self.rbf_model = rbf_model
-        self.prev_err = 0
-        self.error = 0
-        self.integral = 0
-        self.derivative = 0
 
     def update(self, target, measured_value, dt):
         """ Update the control signal according to error and adapt with RBF
@@ -61,15 +70,39 @@ class AdaptivePIDTf:
         -------
         Control signal.
         """
-        self.error = target - measured_value
-        self.integral += self.error * dt
-        self.derivative = (self.error - self.prev_err) / dt
+        return super().update(target, measured_value, dt, self._adapt)
+
+    def set_gains(self, Kp, Ki, Kd):
+        """ Change gains without a bump in the output, including the RBF model prediction.
+
+        Parameters
+        ----------
+            Kp : float
+                Proportional gain.
+            Ki : float
+                Integral gain.
+            Kd : float
+                Derivative gain.
+        """
+        super().set_gains(Kp, Ki, Kd, self._adapt)
 
-        u = (self.Kp * self.error) + (self.Ki * self.integral) + (self.Kd*self.derivative)
+    def bumpless_transfer(self, u, target, measured_value):
+        """ Initialize the state so the next output continues from u, including
+        the RBF model prediction.
 
-        control_signal_adapt = self.rbf_model(tf.constant([[self.error, self.integral, self.derivative]])).numpy().flatten()[0]
-        u += control_signal_adapt
+        Parameters
+        ----------
+            u : float
+                Control signal currently applied.
+            target : float
+                Target setpoint.
+            measured_value : float
+                Actual value.
+        """
+        super().bumpless_transfer(u, target, measured_value, self._adapt)
 
-        self.prev_err = self.error
-        return u
-        
\ No newline at end of file
+    def _adapt(self, error, integral, derivative):
+        """ RBF model prediction from the PID terms, one batched call for all loops. """
+        x = np.stack(np.broadcast_arrays(error, integral, derivative), axis=-1)
+        control_signal_adapt = self.rbf_model(tf.constant(x.reshape(-1, 3), dtype=tf.float32)).numpy()
+        return control_signal_adapt.reshape(x.shape[:-1]).astype(np.float64)
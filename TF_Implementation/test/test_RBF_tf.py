@@ -1,7 +1,8 @@
 import unittest
 import numpy as np
 import tensorflow as tf
-from RBF_tf import RBFLayer, RBFAdaptiveModel, train_rbf_adaptive
+from RBF_tf import (RBFLayer, RBFAdaptiveModel, RBFModelBuffer, RBFLookupTable, 
+                    train_rbf_adaptive, clone_rbf_adaptive, compile_rbf_lut)
 
 class TestRBFLayer(unittest.TestCase):
     def setUp(self):
@@ -53,5 +54,76 @@ class TestRBFAdaptiveModel(unittest.TestCase):
         new_weights = self.model.rbf_layer.centers.numpy()
         self.assertFalse(np.array_equal(initial_weights, new_weights))
 
+    def test_clone(self):
+        """ Test the clone matches the model and is independent of it."""
+        inputs = tf.random.normal((3, self.input_dim))
+        clone = clone_rbf_adaptive(self.model)
+        np.testing.assert_allclose(clone(inputs).numpy(), self.model(inputs).numpy())
+
+        self.model.rbf_layer.centers.assign_add(tf.ones((self.n_centers, self.input_dim)))
+        self.assertFalse(np.allclose(clone(inputs).numpy(), self.model(inputs).numpy()))
+
+class TestRBFModelBuffer(unittest.TestCase):
+    def setUp(self):
+        """ Set up a RBFModelBuffer class instance."""
+        self.n_centers = 5
+        self.input_dim = 3
+        self.model = RBFAdaptiveModel(self.n_centers, self.input_dim)
+        self.buffer = RBFModelBuffer(self.model)
+        self.inputs = tf.random.normal((3, self.input_dim))
+
+    def test_call(self):
+        """ Test the buffer calls the published model."""
+        np.testing.assert_allclose(self.buffer(self.inputs).numpy(), self.model(self.inputs).numpy())
+
+    def test_background_training(self):
+        """ Test background training publishes without touching the front in between."""
+        front = self.buffer.front
+        front_centers = front.rbf_layer.centers.numpy().copy()
+        model_centers = self.model.rbf_layer.centers.numpy().copy()
+
+        errors = np.random.normal(size=(100, self.input_dim))
+        control_signals = np.random.normal(size=(100, 1))
+        self.buffer.start()
+        self.buffer.submit(errors, control_signals, epochs=5)
+        self.buffer.stop()
+
+        np.testing.assert_array_equal(front.rbf_layer.centers.numpy(), front_centers)
+        np.testing.assert_array_equal(self.model.rbf_layer.centers.numpy(), model_centers)
+        self.assertIsNot(self.buffer.front, front)
+        self.assertFalse(np.allclose(self.buffer.front.rbf_layer.centers.numpy(), front_centers))
+
+class TestRBFLookupTable(unittest.TestCase):
+    def setUp(self):
+        """ Set up a RBFAdaptiveModel and its lookup table."""
+        self.n_centers = 5
+        self.input_dim = 3
+        self.bounds = [[-1.0, 1.0], [-1.0, 1.0], [-1.0, 1.0]]
+        self.model = RBFAdaptiveModel(self.n_centers, self.input_dim)
+        self.model(tf.zeros((1, self.input_dim)))
+        self.lut = compile_rbf_lut(self.model, self.bounds, resolution=16)
+
+    def test_compile(self):
+        """ Test the compiled grid shape and error bound."""
+        self.assertIsInstance(self.lut, RBFLookupTable)
+        self.assertEqual(self.lut.values.shape, (16, 16, 16))
+        self.assertGreater(self.lut.error_bound, 0)
+
+    def test_call_within_error_bound(self):
+        """ Test interpolated outputs stay within the reported error bound."""
+        inputs = tf.random.uniform((200, self.input_dim), -1.0, 1.0)
+        output = self.lut(inputs)
+
+        self.assertEqual(output.shape, (200, 1))
+        error = np.max(np.abs(output.numpy() - self.model(inputs).numpy()))
+        self.assertLessEqual(error, self.lut.error_bound + 1e-5)
+
+    def test_invalid(self):
+        """ Test inverted bounds and inputs of the wrong length are rejected."""
+        with self.assertRaises(ValueError):
+            compile_rbf_lut(self.model, [[1.0, -1.0], [-1.0, 1.0], [-1.0, 1.0]])
+        with self.assertRaises(ValueError):
+            self.lut(tf.zeros((1, 2)))
+
 if __name__ == '__main__':
     unittest.main()
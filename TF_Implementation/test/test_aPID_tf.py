@@ -53,5 +53,33 @@ class TestAdaptivePIDTf(unittest.TestCase):
         self.assertNotEqual(control_signal_before, control_signal_after)
         self.assertLess((self.target - measured_value), self.target - self.measured_value)
 
+    def test_vectorized(self):
+        """ Test many loops run with one batched model call and match single loops."""
+        targets = np.array([10.0, 5.0])
+        measured = np.array([8.0, 6.0])
+        control_signals = self.apid.update(targets, measured, self.dt)
+
+        self.assertEqual(control_signals.shape, (2,))
+        for i in range(2):
+            single = AdaptivePIDTf(self.Kp, self.Ki, self.Kd, self.rbf_model)
+            self.assertAlmostEqual(control_signals[i], single.update(targets[i], measured[i], self.dt), places=5)
+
+    def test_saturation(self):
+        """ Test the output is clamped to its limits."""
+        apid = AdaptivePIDTf(self.Kp, self.Ki, self.Kd, self.rbf_model, u_min=-1.0, u_max=1.0)
+        self.assertEqual(apid.update(self.target, self.measured_value, self.dt), 1.0)
+
 if __name__ == '__main__':
     unittest.main()
+
+    def test_bumpless(self):
+        """ Test bumpless transfer and gain changes account for the RBF adaptation."""
+        self.rbf_model.output_layer.kernel.assign(np.full((self.n_centers, 1), 0.5))
+        apid = AdaptivePIDTf(2.0, 0.5, 0.1, self.rbf_model)
+        apid.bumpless_transfer(1.25, 1.0, 0.5)
+        self.assertAlmostEqual(apid.update(1.0, 0.5, 0.0), 1.25, places=5)
+
+        apid.update(1.0, 0.5, self.dt)
+        control_signal = apid.update(1.0, 0.5, 0.0)
+        apid.set_gains(4.0, 1.0, 0.3)
+        self.assertAlmostEqual(apid.update(1.0, 0.5, 0.0), control_signal, places=5)
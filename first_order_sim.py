@@ -5,9 +5,10 @@ from NP_Implementation.RBF_numpy import RBFNetwork
 from NP_Implementation.aPID_numpy import AdaptivePIDNP
 from TF_Implementation.RBF_tf import RBFAdaptiveModel, train_rbf_adaptive
 from TF_Implementation.aPID_tf import AdaptivePIDTf
+from plant_models import FirstOrderPlant
 
-def simulate_system(controller, target, dt, T):
-    """ Simulate control model as first order system.
+def simulate_system(controller, target, dt, T, plant=None):
+    """ Simulate control model on a plant, first order system by default.
 
     Parameters
     ----------
@@ -19,25 +20,32 @@ def simulate_system(controller, target, dt, T):
         Timestep.
     T : float64
         Total time range to simulate.
+    plant : Plant
+        Plant to control, see plant_models. Defaults to a first order plant
+        integrated with one forward Euler step per sample.
     
     Returns
     -------
     Timesteps and measured_value at each.
     
     """
+    if plant is None:
+        plant = FirstOrderPlant(integrator="euler")
+    plant.reset()
+
     time = np.arange(0, T, dt)
-    measured_value = 0.0
+    measured_value = plant.measurement()
     measurements = []
 
     for t in time:
         control_signal = controller.update(target, measured_value, dt)
-        measured_value += (control_signal - measured_value) * dt 
+        measured_value = plant.step(control_signal, dt)
         measurements.append(measured_value)
         print(f"Control Signal: {control_signal:.2f}, Measurement: {measured_value:.2f}")
 
     return time, measurements
 
-def simulate_rbf_train_data(rbf_tf, apid_tf, n_epochs=100, n_samples=100):
+def simulate_rbf_train_data(rbf_tf, apid_tf, n_epochs=100, n_samples=100, plant=None):
     """ Simulate training data using the RBF model and aPID.
 
     Parameters
@@ -50,6 +58,9 @@ def simulate_rbf_train_data(rbf_tf, apid_tf, n_epochs=100, n_samples=100):
             Number of epochs to simulate.
         n_samples : int
             Number of samples per epoch to simulate.
+        plant : Plant
+            Plant to control, see plant_models. Defaults to a first order plant
+            integrated with one forward Euler step per sample.
     
     Returns
     -------
@@ -57,18 +68,22 @@ def simulate_rbf_train_data(rbf_tf, apid_tf, n_epochs=100, n_samples=100):
     """
     rbf_tf.compile(optimizer="adam", loss="mean_squared_error")
 
+    if plant is None:
+        plant = FirstOrderPlant(integrator="euler")
+    plant.reset()
+
     errors = []
     control_signals = []
 
     target = 1.0
-    measured_value = 0.0
+    measured_value = plant.measurement()
     dt = 0.1
 
     for epoch in range(n_epochs):
         print(f"Epoch: {epoch}")
         for sample in range(n_samples):
             control_signal = apid_tf.update(target, measured_value, dt)
-            measured_value += (control_signal - measured_value) * dt 
+            measured_value = plant.step(control_signal, dt)
             error = target - measured_value
 
             errors.append([error, apid_tf.integral, apid_tf.derivative])
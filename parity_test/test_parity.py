@@ -0,0 +1,246 @@
+import json
+import os
+import subprocess
+import time
+import unittest
+import numpy as np
+
+from NP_Implementation.RBF_numpy import RBFNetwork, RBFNetworkBuffer
+from NP_Implementation.aPID_numpy import AdaptivePIDNP
+
+try:
+    import tensorflow as tf
+    from TF_Implementation.RBF_tf import RBFAdaptiveModel, RBFModelBuffer, compile_rbf_lut
+    from TF_Implementation.aPID_tf import AdaptivePIDTf
+except ImportError:
+    tf = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+HARNESS = os.environ.get("PARITY_HARNESS", os.path.join(ROOT, "CPP_Implementation", "build", "parity_harness"))
+TOLERANCE = float(os.environ.get("PARITY_TOLERANCE", "0.5"))   # fraction of baseline required
+RECORD = os.environ.get("PARITY_RECORD") == "1"                 # overwrite baselines with measured values
+ABSOLUTE = os.environ.get("PARITY_ABSOLUTE") == "1"             # also check machine specific calls/s
+SPEEDUPS = [("np_lut", "np_predict"), ("np_batch", "np_predict"), ("tf_lut", "tf_call"), ("cpp_lut", "cpp_predict")]
+
+N_CENTERS = 8
+INPUT_DIM = 3
+SIGMA = 0.8
+N_SAMPLES = 200
+RESOLUTION = 24
+BOUNDS = np.array([[-1.0, 1.0], [-1.0, 1.0], [-2.0, 2.0]])
+KP, KI, KD, DT = 4.0, 0.1, 0.01, 0.1
+
+def make_case():
+    """ Build the shared centers, weights, inputs, and PID stream. """
+    rng = np.random.default_rng(29)
+    centers = rng.uniform(BOUNDS[:, 0], BOUNDS[:, 1], size=(N_CENTERS, INPUT_DIM))
+    weights = rng.normal(size=N_CENTERS)
+    inputs = rng.uniform(BOUNDS[:, 0], BOUNDS[:, 1], size=(N_SAMPLES, INPUT_DIM))
+    # Smooth error so [error, integral, derivative] stays near the centers and the adaptation matters
+    targets = np.ones(50)
+    measured = targets - 0.5 * np.sin(0.2 * np.arange(50))
+    return centers, weights, inputs, targets, measured
+
+def make_np(centers, weights):
+    """ Numpy network with the given parameters. """
+    network = RBFNetwork(INPUT_DIM, N_CENTERS)
+    network.centers = centers.copy()
+    network.weights = weights.copy()
+    network.sigma = SIGMA
+    return network
+
+def make_tf(centers, weights):
+    """ TF model with the given parameters and no output bias. """
+    model = RBFAdaptiveModel(N_CENTERS, INPUT_DIM)
+    model(tf.zeros((1, INPUT_DIM)))
+    model.rbf_layer.centers.assign(centers)
+    model.rbf_layer.sigmas.assign(np.full(N_CENTERS, SIGMA))
+    model.output_layer.kernel.assign(weights[:, np.newaxis])
+    model.output_layer.bias.assign([0.0])
+    return model
+
+def run_harness(centers, weights, inputs, targets, measured, n_repeats=200):
+    """ Run the C++ harness and parse its labelled output lines. """
+    tokens = [N_CENTERS, INPUT_DIM, SIGMA, *centers.ravel(), *weights,
+              N_SAMPLES, *inputs.ravel(),
+              RESOLUTION, *BOUNDS[:, 0], *BOUNDS[:, 1],
+              KP, KI, KD, DT, len(measured), *np.column_stack([targets, measured]).ravel(),
+              n_repeats]
+    stdin = " ".join(repr(float(token)) if isinstance(token, (float, np.floating)) else str(token) 
+                     for token in tokens)
+    result = subprocess.run([HARNESS], input=stdin, capture_output=True, text=True, check=True)
+
+    output = {}
+    for line in result.stdout.splitlines():
+        label, *values = line.split()
+        output[label] = np.array(values, dtype=np.float64)
+    return output
+
+def throughput(predict, inputs, min_time=0.2):
+    """ Single input calls per second, repeating passes for at least min_time. """
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < min_time:
+        for x in inputs:
+            predict(x)
+        calls += len(inputs)
+    return calls / (time.perf_counter() - start)
+
+def batch_throughput(predict, inputs, min_time=0.2):
+    """ Inputs per second of batched calls over all inputs, repeating for at least min_time. """
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < min_time:
+        predict(inputs)
+        calls += len(inputs)
+    return calls / (time.perf_counter() - start)
+
+
+class TestNumericalParity(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """ Build every implementation from the same parameters. """
+        cls.centers, cls.weights, cls.inputs, cls.targets, cls.measured = make_case()
+        cls.network = make_np(cls.centers, cls.weights)
+        cls.lut = cls.network.compile_lut(BOUNDS, RESOLUTION)
+        cls.expected = np.array([cls.network.predict(x) for x in cls.inputs])
+
+    def test_np_lut(self):
+        """ Test the Numpy lookup table, single and batched, against the network."""
+        batched = self.lut.predict(self.inputs)
+        single = np.array([self.lut.predict(x) for x in self.inputs])
+
+        np.testing.assert_allclose(batched, single, rtol=0, atol=1e-12)
+        self.assertLessEqual(np.max(np.abs(batched - self.expected)), self.lut.error_bound)
+
+    def test_np_batch(self):
+        """ Test the batched Numpy network against single inputs and the C++ model."""
+        batched = self.network.predict(self.inputs)
+        np.testing.assert_allclose(batched, self.expected, rtol=0, atol=1e-12)
+
+        if os.path.exists(HARNESS):
+            output = run_harness(self.centers, self.weights, self.inputs, self.targets, self.measured, n_repeats=1)
+            np.testing.assert_allclose(batched, output["predict"], rtol=1e-12, atol=1e-12)
+
+    def test_buffers(self):
+        """ Test the Numpy, TF, and C++ buffers predict like the networks they publish."""
+        buffer = RBFNetworkBuffer(self.network)
+        np.testing.assert_allclose(buffer.predict(self.inputs), self.expected, rtol=0, atol=1e-12)
+
+        # An empty batch publishes the network back from the worker process unchanged
+        buffer.submit(np.empty((0, INPUT_DIM)), np.empty(0))
+        buffer.start()
+        buffer.stop()
+        np.testing.assert_allclose([buffer.predict(x) for x in self.inputs], self.expected, rtol=0, atol=1e-12)
+
+        if tf is not None:
+            tf_buffer = RBFModelBuffer(make_tf(self.centers, self.weights))
+            output = tf_buffer(tf.constant(self.inputs, dtype=tf.float32)).numpy()[:, 0]
+            np.testing.assert_allclose(output, self.expected, rtol=0, atol=1e-5)
+
+        if os.path.exists(HARNESS):
+            output = run_harness(self.centers, self.weights, self.inputs, self.targets, self.measured, n_repeats=1)
+            np.testing.assert_allclose(output["buffer"], self.expected, rtol=1e-12, atol=1e-12)
+
+    @unittest.skipIf(tf is None, "tensorflow is not installed")
+    def test_tf(self):
+        """ Test the TF model, batched and per sample, and its lookup table."""
+        model = make_tf(self.centers, self.weights)
+        batched = model(tf.constant(self.inputs, dtype=tf.float32)).numpy()[:, 0]
+        single = np.array([model(tf.constant([x], dtype=tf.float32)).numpy()[0, 0] for x in self.inputs[:20]])
+        np.testing.assert_allclose(batched, self.expected, rtol=0, atol=1e-5)
+        np.testing.assert_allclose(single, self.expected[:20], rtol=0, atol=1e-5)
+
+        lut = compile_rbf_lut(model, BOUNDS, RESOLUTION)
+        np.testing.assert_allclose(lut(self.inputs).numpy()[:, 0], self.lut.predict(self.inputs), rtol=0, atol=1e-5)
+
+    @unittest.skipUnless(os.path.exists(HARNESS), "C++ parity_harness is not built")
+    def test_cpp(self):
+        """ Test the C++ model and lookup table."""
+        output = run_harness(self.centers, self.weights, self.inputs, self.targets, self.measured, n_repeats=1)
+        np.testing.assert_allclose(output["predict"], self.expected, rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(output["lut"], self.lut.predict(self.inputs), rtol=1e-9, atol=1e-12)
+
+    def test_pid(self):
+        """ Test the PID controllers agree on the same stream with the shared RBF adaptation."""
+        def run(controller):
+            return np.array([controller.update(target, measured, DT) 
+                             for target, measured in zip(self.targets, self.measured)])
+
+        expected = run(AdaptivePIDNP(KP, KI, KD, make_np(self.centers, self.weights)))
+        unadapted = run(AdaptivePIDNP(KP, KI, KD, make_np(self.centers, np.zeros(N_CENTERS))))
+        self.assertGreater(np.max(np.abs(expected - unadapted)), 0.1)
+
+        if tf is not None:
+            output = run(AdaptivePIDTf(KP, KI, KD, make_tf(self.centers, self.weights)))
+            np.testing.assert_allclose(output, expected, rtol=1e-5, atol=1e-5)
+
+        if os.path.exists(HARNESS):
+            output = run_harness(self.centers, self.weights, self.inputs, self.targets, self.measured, n_repeats=1)
+            np.testing.assert_allclose(output["pid"], expected, rtol=1e-12, atol=1e-12)
+
+
+class TestThroughput(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """ Measure the throughput of every available path, in inputs per second. """
+        centers, weights, inputs, targets, measured = make_case()
+        network = make_np(centers, weights)
+        lut = network.compile_lut(BOUNDS, RESOLUTION)
+
+        cls.measured = {
+            "np_predict": throughput(network.predict, inputs),
+            "np_lut": throughput(lut.predict, inputs),
+            "np_batch": batch_throughput(network.predict, inputs),
+        }
+        if tf is not None:
+            model = make_tf(centers, weights)
+            tf_lut = compile_rbf_lut(model, BOUNDS, RESOLUTION)
+            tf_inputs = [tf.constant([x], dtype=tf.float32) for x in inputs[:20]]
+            cls.measured["tf_call"] = throughput(model, tf_inputs)
+            cls.measured["tf_lut"] = throughput(tf_lut, tf_inputs)
+        if os.path.exists(HARNESS):
+            output = run_harness(centers, weights, inputs, targets, measured)
+            cls.measured["cpp_predict"] = output["throughput_predict"][0]
+            cls.measured["cpp_lut"] = output["throughput_lut"][0]
+
+        cls.speedups = {f"{fast}/{slow}": cls.measured[fast] / cls.measured[slow]
+                        for fast, slow in SPEEDUPS if slow in cls.measured}
+
+        with open(BASELINES) as f:
+            cls.baselines = json.load(f)
+        if RECORD:
+            cls.baselines["absolute"] = {name: float(f"{value:.4g}") for name, value in cls.measured.items()}
+            cls.baselines["speedup"] = {name: float(f"{value:.4g}") for name, value in cls.speedups.items()}
+            with open(BASELINES, "w") as f:
+                json.dump(cls.baselines, f, indent=4, sort_keys=True)
+                f.write("\n")
+
+    def test_speedup_baselines(self):
+        """ Test no fast path lost its recorded speedup over the path it replaces."""
+        for name, value in self.speedups.items():
+            with self.subTest(path=name):
+                baseline = self.baselines["speedup"].get(name)
+                self.assertIsNotNone(baseline, "no baseline recorded, run with PARITY_RECORD=1")
+                self.assertGreaterEqual(value, TOLERANCE * baseline, 
+                                        f"{name}: {value:.1f}x faster, baseline {baseline:.1f}x")
+
+    @unittest.skipUnless(ABSOLUTE, "absolute throughput is machine specific, set PARITY_ABSOLUTE=1")
+    def test_absolute_baselines(self):
+        """ Test no path dropped below its recorded calls per second on this machine."""
+        for name, value in self.measured.items():
+            with self.subTest(path=name):
+                baseline = self.baselines["absolute"].get(name)
+                self.assertIsNotNone(baseline, "no baseline recorded, run with PARITY_RECORD=1")
+                self.assertGreaterEqual(value, TOLERANCE * baseline,
+                                        f"{name}: {value:.0f} calls/s, baseline {baseline:.0f}")
+
+    def test_lut_faster(self):
+        """ Test each lookup table and batched path is faster than the path it replaces."""
+        for name, value in self.speedups.items():
+            with self.subTest(path=name):
+                self.assertGreater(value, 1.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+import numpy as np
+
+# Secant iterations when solving for the integral with the adaptation
+SOLVE_ITERATIONS = 20
+
+class PIDCore:
+    """ PID core shared by the adaptive PID implementations.
+
+    Computes the PID terms with setpoint weighting, a first order derivative
+    filter, output saturation, and anti-windup by conditional integration. The
+    integral is held while the output is saturated and the integral term
+    would push it further. Timesteps that are not positive skip integration and hold the
+    derivative. Gains, limits, and inputs may be numpy arrays to run many
+    loops at once. The defaults reproduce a plain PID on the error.
+
+    ...
+
+    Attributes
+    ----------
+    Kp : float64 or ndarray
+        Proportional gain.
+    Ki : float64 or ndarray
+        Integral gain.
+    Kd : float64 or ndarray
+        Derivative gain.
+    b : float64 or ndarray
+        Setpoint weight of the proportional term.
+    c : float64 or ndarray
+        Setpoint weight of the derivative term.
+    Tf : float64 or ndarray
+        Derivative filter time constant, 0 for no filter.
+    u_min : float64 or ndarray
+        Lower output limit.
+    u_max : float64 or ndarray
+        Upper output limit.
+
+    Methods
+    -------
+    update(target, measured_value, dt, adapt):
+        Updates the control signal.
+    set_gains(Kp, Ki, Kd, adapt):
+        Changes gains without a bump in the output, when Ki is not zero.
+    bumpless_transfer(u, target, measured_value, adapt):
+        Initializes the state so the next output continues from u.
+    """
+    def __init__(self, Kp, Ki, Kd, b=1.0, c=1.0, Tf=0.0, u_min=-np.inf, u_max=np.inf):
+        """ Constructs PID gains, limits, and initial PID components.
+
+        Parameters
+        ----------
+            Kp : float64 or ndarray
+                Proportional gain.
+            Ki : float64 or ndarray
+                Integral gain.
+            Kd : float64 or ndarray
+                Derivative gain.
+            b : float64 or ndarray
+                Setpoint weight of the proportional term.
+            c : float64 or ndarray
+                Setpoint weight of the derivative term.
+            Tf : float64 or ndarray
+                Derivative filter time constant, 0 for no filter.
+            u_min : float64 or ndarray
+                Lower output limit.
+            u_max : float64 or ndarray
+                Upper output limit.
+        """
+        self.Kp = Kp
+        self.Ki = Ki
+        self.Kd = Kd
+        self.b = b
+        self.c = c
+        self.Tf = Tf
+        self.u_min = u_min
+        self.u_max = u_max
+        self.prev_err = 0
+        self.error = 0
+        self.error_p = 0
+        self.integral = 0
+        self.derivative = 0
+
+    def update(self, target, measured_value, dt, adapt=None):
+        """ Update the control signal.
+
+        Parameters
+        ----------
+            target : float64 or ndarray
+                Target setpoint.
+            measured_value : float64 or ndarray
+                Actual value.
+            dt : float64 or ndarray
+                Timestep.
+            adapt : callable
+                Optional adapt(error, integral, derivative) returning a value
+                added to the control signal before saturation.
+
+        Returns
+        -------
+        Control signal.
+        """
+        valid = np.asarray(dt) > 0
+        safe_dt = np.where(valid, dt, 1.0)
+
+        error = np.subtract(target, measured_value)
+        error_p = np.multiply(self.b, target) - measured_value
+        error_d = np.multiply(self.c, target) - measured_value
+
+        integral = self.integral + np.where(valid, error * safe_dt, 0.0)
+        alpha = self.Tf / (self.Tf + safe_dt)
+        derivative = alpha * self.derivative + (1 - alpha) * (error_d - self.prev_err) / safe_dt
+        derivative = np.where(valid, derivative, self.derivative)
+
+        u_adapt = 0.0 if adapt is None else adapt(error, integral, derivative)
+        u = self.Kp * error_p + self.Ki * integral + self.Kd * derivative + u_adapt
+
+        # Anti-windup, hold the integral while saturated in the direction the integral pushes
+        Ki_error = np.multiply(self.Ki, error)
+        windup = ((u > self.u_max) & (Ki_error > 0)) | ((u < self.u_min) & (Ki_error < 0))
+        u = np.where(windup, u - self.Ki * (integral - self.integral), u)
+        integral = np.where(windup, self.integral, integral)
+
+        self.error = self._scalar(error)
+        self.error_p = self._scalar(error_p)
+        self.integral = self._scalar(integral)
+        self.derivative = self._scalar(derivative)
+        self.prev_err = self._scalar(np.where(valid, error_d, self.prev_err))
+        return self._scalar(np.clip(u, self.u_min, self.u_max))
+
+    def set_gains(self, Kp, Ki, Kd, adapt=None):
+        """ Change gains without a bump in the output. The integral absorbs the
+        change in the proportional and derivative terms of the last update, and
+        the change in the adaptation since the integral is one of its inputs,
+        so the same inputs give the same output. With a zero new Ki the
+        integral is kept as is and the output can jump.
+
+        Parameters
+        ----------
+            Kp : float64 or ndarray
+                Proportional gain.
+            Ki : float64 or ndarray
+                Integral gain.
+            Kd : float64 or ndarray
+                Derivative gain.
+            adapt : callable
+                Optional adapt(error, integral, derivative), as in update.
+        """
+        u = (np.multiply(self.Kp, self.error_p) + np.multiply(self.Ki, self.integral)
+             + np.multiply(self.Kd, self.derivative))
+        if adapt is not None:
+            u = u + adapt(self.error, self.integral, self.derivative)
+        terms = np.multiply(Kp, self.error_p) + np.multiply(Kd, self.derivative)
+        integral = self._solve_integral(u, terms, Ki, self.error, self.derivative, adapt)
+        self.integral = self._scalar(np.where(np.asarray(Ki) != 0, integral, self.integral))
+        self.Kp = Kp
+        self.Ki = Ki
+        self.Kd = Kd
+
+    def bumpless_transfer(self, u, target, measured_value, adapt=None):
+        """ Initialize the state so the next output continues from u, e.g. when
+        switching from manual to automatic control.
+
+        Parameters
+        ----------
+            u : float64 or ndarray
+                Control signal currently applied.
+            target : float64 or ndarray
+                Target setpoint.
+            measured_value : float64 or ndarray
+                Actual value.
+            adapt : callable
+                Optional adapt(error, integral, derivative), as in update.
+        """
+        error = np.subtract(target, measured_value)
+        error_p = np.multiply(self.b, target) - measured_value
+        integral = self._solve_integral(u, np.multiply(self.Kp, error_p), self.Ki, error, 0.0, adapt)
+
+        self.error = self._scalar(error)
+        self.error_p = self._scalar(error_p)
+        self.integral = self._scalar(np.where(np.asarray(self.Ki) != 0, integral, 0.0))
+        self.derivative = self._scalar(np.zeros_like(integral))
+        self.prev_err = self._scalar(np.multiply(self.c, target) - measured_value)
+
+    @staticmethod
+    def _solve_integral(u, terms, Ki, error, derivative, adapt):
+        """ Integral that makes terms + Ki * integral + adapt(error, integral, derivative)
+        equal u. Secant iteration from the solution without adaptation, keeping
+        the best iterate. Entries with a zero Ki are meaningless. """
+        Ki = np.where(np.asarray(Ki) != 0, Ki, 1.0)
+        integral = (u - terms) / Ki
+        if adapt is None:
+            return integral
+
+        def residual(value):
+            return terms + Ki * value + adapt(error, value, derivative) - u
+
+        prev, r_prev = integral, residual(integral)
+        best, r_best = integral, np.abs(r_prev)
+        integral = integral - r_prev / Ki
+        for _ in range(SOLVE_ITERATIONS):
+            if np.all(r_best <= 1e-12 * (1.0 + np.abs(u))):
+                break
+            r = residual(integral)
+            improved = np.abs(r) < r_best
+            best = np.where(improved, integral, best)
+            r_best = np.where(improved, np.abs(r), r_best)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                slope = (r - r_prev) / (integral - prev)
+            slope = np.where(np.isfinite(slope) & (slope != 0), slope, Ki)
+            prev, r_prev = integral, r
+            integral = integral - r / slope
+        return best
+
+    @staticmethod
+    def _scalar(value):
+        """ Unwrap 0-d arrays so single loops keep scalar state. """
+        return np.asarray(value)[()]
@@ -0,0 +1,501 @@
+import abc
+import collections
+
+import numpy as np
+
+# Dormand-Prince 5(4) coefficients
+DP_C = np.array([0.0, 1/5, 3/10, 4/5, 8/9, 1.0, 1.0])
+DP_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+DP_B = np.array([35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84, 0.0])
+DP_E = DP_B - np.array([5179/57600, 0.0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+
+# Rejected rk45 steps in a row before the sample fails
+MAX_REJECTIONS = 100
+
+def euler_step(f, x, u, h):
+    """ Advance the state one forward Euler step.
+
+    Parameters
+    ----------
+        f : callable
+            State derivative f(x, u).
+        x : ndarray
+            Current state.
+        u : float64
+            Input, held over the step.
+        h : float64
+            Step size.
+
+    Returns
+    -------
+    State after the step.
+    """
+    return x + h * f(x, u)
+
+def rk4_step(f, x, u, h):
+    """ Advance the state one classic fourth order Runge-Kutta step.
+
+    Parameters
+    ----------
+        f : callable
+            State derivative f(x, u).
+        x : ndarray
+            Current state.
+        u : float64
+            Input, held over the step.
+        h : float64
+            Step size.
+
+    Returns
+    -------
+    State after the step.
+    """
+    k1 = f(x, u)
+    k2 = f(x + 0.5 * h * k1, u)
+    k3 = f(x + 0.5 * h * k2, u)
+    k4 = f(x + h * k3, u)
+    return x + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+def rk45_step(f, x, u, h):
+    """ Advance the state one Dormand-Prince 5(4) step with error estimate.
+
+    Parameters
+    ----------
+        f : callable
+            State derivative f(x, u).
+        x : ndarray
+            Current state.
+        u : float64
+            Input, held over the step.
+        h : float64
+            Step size.
+
+    Returns
+    -------
+    Fifth order state after the step and the local error estimate.
+    """
+    k = []
+    for a in DP_A:
+        k.append(f(x + h * sum(a_j * k_j for a_j, k_j in zip(a, k)), u))
+    k = np.array(k)
+    return x + h * DP_B @ k, h * DP_E @ k
+
+
+class Plant(abc.ABC):
+    """ Base plant class for simulation.
+
+    The controller calls step once per sample with the control signal, which
+    is held constant over the sample (zero order hold).
+
+    ...
+
+    Methods
+    -------
+    reset():
+        Resets the plant to its initial state.
+    step(u, dt):
+        Advances the plant one controller sample.
+    measurement():
+        Current measured value.
+    """
+    @abc.abstractmethod
+    def reset(self):
+        """ Reset the plant to its initial state. """
+
+    @abc.abstractmethod
+    def measurement(self):
+        """ Current measured value, e.g. the initial output after reset.
+
+        Returns
+        -------
+        Measured value.
+        """
+
+    @abc.abstractmethod
+    def step(self, u, dt):
+        """ Advance the plant one controller sample.
+
+        Parameters
+        ----------
+            u : float64
+                Control signal, held over the sample.
+            dt : float64
+                Controller timestep.
+
+        Returns
+        -------
+        Measured value at the end of the sample.
+        """
+
+
+class ContinuousPlant(Plant):
+    """ Continuous time plant integrated between controller samples.
+
+    The integrator runs at its own internal step, independent of the
+    controller timestep. Fixed step integrators split each sample into
+    equal steps no larger than max_step. The adaptive integrator keeps its
+    step size across samples and only shortens it to land on sample ends.
+
+    ...
+
+    Attributes
+    ----------
+    integrator : str
+        One of "euler", "rk4" or "rk45".
+    max_step : float64 or None
+        Largest internal step. None uses one step per sample for fixed step
+        integrators and no limit for "rk45".
+    rtol : float64
+        Relative tolerance of "rk45".
+    atol : float64
+        Absolute tolerance of "rk45".
+    state : ndarray
+        Current state.
+
+    Methods
+    -------
+    derivative(x, u):
+        State derivative.
+    output(x):
+        Measured value of a state.
+    """
+    def __init__(self, x0, integrator="rk4", max_step=None, rtol=1e-6, atol=1e-9):
+        """ Constructs the initial state and integrator settings.
+
+        Parameters
+        ----------
+            x0 : array_like
+                Initial state.
+            integrator : str
+                One of "euler", "rk4" or "rk45".
+            max_step : float64 or None
+                Largest internal step.
+            rtol : float64
+                Relative tolerance of "rk45".
+            atol : float64
+                Absolute tolerance of "rk45".
+        """
+        if integrator not in ("euler", "rk4", "rk45"):
+            raise ValueError(f"Unknown integrator: {integrator}")
+        self.x0 = np.array(x0, dtype=np.float64)
+        self.integrator = integrator
+        self.max_step = max_step
+        self.rtol = rtol
+        self.atol = atol
+        self.reset()
+
+    @abc.abstractmethod
+    def derivative(self, x, u):
+        """ State derivative.
+
+        Parameters
+        ----------
+            x : ndarray
+                State.
+            u : float64
+                Input.
+
+        Returns
+        -------
+        Derivative of the state.
+        """
+
+    def output(self, x):
+        """ Measured value of a state.
+
+        Parameters
+        ----------
+            x : ndarray
+                State.
+
+        Returns
+        -------
+        Measured value.
+        """
+        return x[0]
+
+    def reset(self):
+        """ Reset the plant to its initial state. """
+        self.state = self.x0.copy()
+        self._h = self.max_step
+
+    def measurement(self):
+        """ Current measured value, see Plant. """
+        return self.output(self.state)
+
+    def step(self, u, dt):
+        """ Advance the plant one controller sample.
+
+        Parameters
+        ----------
+            u : float64
+                Control signal, held over the sample.
+            dt : float64
+                Controller timestep.
+
+        Returns
+        -------
+        Measured value at the end of the sample.
+        """
+        if self.integrator == "rk45":
+            self.state = self._step_adaptive(u, dt)
+        else:
+            stepper = euler_step if self.integrator == "euler" else rk4_step
+            n_steps = 1 if self.max_step is None else max(1, int(np.ceil(dt / self.max_step)))
+            h = dt / n_steps
+            for _ in range(n_steps):
+                self.state = stepper(self.derivative, self.state, u, h)
+        return self.output(self.state)
+
+    def _step_adaptive(self, u, dt):
+        """ Integrate one sample with step size control. Steps with a non-finite
+        error are rejected, and the step fails once it falls below a few ulps
+        of dt or after MAX_REJECTIONS rejections in a row. """
+        x = self.state
+        t = 0.0
+        h = dt if self._h is None else self._h
+        h_min = 16 * np.spacing(dt)
+        rejections = 0
+        while dt - t > h_min:
+            h_step = min(h, dt - t)
+            x_new, error = rk45_step(self.derivative, x, u, h_step)
+            scale = self.atol + self.rtol * np.maximum(np.abs(x), np.abs(x_new))
+            error_norm = np.sqrt(np.mean((error / scale) ** 2))
+
+            if error_norm <= 1.0:
+                t += h_step
+                x = x_new
+                rejections = 0
+                if h_step < h:
+                    continue    # shortened to land on the sample end, keep h
+            else:
+                rejections += 1
+                if not np.isfinite(error_norm):
+                    error_norm = np.inf
+
+            factor = 5.0 if error_norm == 0 else min(5.0, max(0.2, 0.9 * error_norm ** -0.2))
+            h = h_step * factor
+            if self.max_step is not None:
+                h = min(h, self.max_step)
+            if h < h_min or rejections > MAX_REJECTIONS:
+                raise RuntimeError(f"rk45 step size underflow at t={t}, the input or state "
+                                   "is not finite or the plant is unstable")
+        self._h = h
+        return x
+
+
+class FirstOrderPlant(ContinuousPlant):
+    """ First order plant, tau * dy/dt = gain * u - y.
+
+    ...
+
+    Attributes
+    ----------
+    gain : float64
+        Steady state gain.
+    tau : float64
+        Time constant.
+    """
+    def __init__(self, gain=1.0, tau=1.0, y0=0.0, **kwargs):
+        """ Constructs plant parameters.
+
+        Parameters
+        ----------
+            gain : float64
+                Steady state gain.
+            tau : float64
+                Time constant.
+            y0 : float64
+                Initial output.
+            **kwargs
+                Integrator settings, see ContinuousPlant.
+        """
+        self.gain = gain
+        self.tau = tau
+        super().__init__([y0], **kwargs)
+
+    def derivative(self, x, u):
+        """ State derivative, see ContinuousPlant. """
+        return (self.gain * u - x) / self.tau
+
+
+class SecondOrderPlant(ContinuousPlant):
+    """ Second order plant, d2y/dt2 + 2 * zeta * wn * dy/dt + wn^2 * y = wn^2 * gain * u.
+
+    ...
+
+    Attributes
+    ----------
+    gain : float64
+        Steady state gain.
+    wn : float64
+        Natural frequency.
+    zeta : float64
+        Damping ratio.
+    """
+    def __init__(self, gain=1.0, wn=1.0, zeta=0.7, y0=0.0, **kwargs):
+        """ Constructs plant parameters.
+
+        Parameters
+        ----------
+            gain : float64
+                Steady state gain.
+            wn : float64
+                Natural frequency.
+            zeta : float64
+                Damping ratio.
+            y0 : float64
+                Initial output.
+            **kwargs
+                Integrator settings, see ContinuousPlant.
+        """
+        self.gain = gain
+        self.wn = wn
+        self.zeta = zeta
+        super().__init__([y0, 0.0], **kwargs)
+
+    def derivative(self, x, u):
+        """ State derivative, see ContinuousPlant. """
+        y, dy = x
+        return np.array([dy, self.wn ** 2 * (self.gain * u - y) - 2 * self.zeta * self.wn * dy])
+
+
+class DeadTimePlant(Plant):
+    """ Delays the input of another plant by a dead time.
+
+    The delay is rounded to a whole number of controller samples.
+
+    ...
+
+    Attributes
+    ----------
+    plant : Plant
+        Delayed plant.
+    delay : float64
+        Dead time.
+    u0 : float64
+        Input seen by the plant before the delay has passed.
+    """
+    def __init__(self, plant, delay, u0=0.0):
+        """ Constructs the delayed plant.
+
+        Parameters
+        ----------
+            plant : Plant
+                Plant to delay.
+            delay : float64
+                Dead time.
+            u0 : float64
+                Input seen by the plant before the delay has passed.
+        """
+        self.plant = plant
+        self.delay = delay
+        self.u0 = u0
+        self.reset()
+
+    def reset(self):
+        """ Reset the plant and clear the delayed inputs. """
+        self.plant.reset()
+        self._inputs = collections.deque()
+
+    def measurement(self):
+        """ Current measured value of the delayed plant. """
+        return self.plant.measurement()
+
+    def step(self, u, dt):
+        """ Advance the plant one controller sample with the delayed input.
+
+        Parameters
+        ----------
+            u : float64
+                Control signal, held over the sample.
+            dt : float64
+                Controller timestep.
+
+        Returns
+        -------
+        Measured value at the end of the sample.
+        """
+        self._inputs.append(u)
+        n_delay = int(round(self.delay / dt))
+        u_delayed = self._inputs.popleft() if len(self._inputs) > n_delay else self.u0
+        return self.plant.step(u_delayed, dt)
+
+
+class StateSpacePlant(Plant):
+    """ Discrete state space plant, x[k+1] = A x[k] + B u[k], y[k] = C x[k] + D u[k].
+
+    Runs at its own sample period. Each controller sample advances the
+    plant by as many of its samples as fit, carrying the remainder over.
+
+    ...
+
+    Attributes
+    ----------
+    A, B, C, D : ndarray
+        State space matrices.
+    Ts : float64 or None
+        Plant sample period. None advances one sample per controller sample.
+    """
+    def __init__(self, A, B, C, D=0.0, Ts=None, x0=None):
+        """ Constructs state space matrices.
+
+        Parameters
+        ----------
+            A, B, C, D : array_like
+                State space matrices.
+            Ts : float64 or None
+                Plant sample period.
+            x0 : array_like or None
+                Initial state, zeros by default.
+        """
+        self.A = np.atleast_2d(np.asarray(A, dtype=np.float64))
+        self.B = np.asarray(B, dtype=np.float64).reshape(len(self.A))
+        self.C = np.asarray(C, dtype=np.float64).reshape(len(self.A))
+        self.D = float(D)
+        self.Ts = Ts
+        self.x0 = np.zeros(len(self.A)) if x0 is None else np.asarray(x0, dtype=np.float64)
+        self.reset()
+
+    def reset(self):
+        """ Reset the plant to its initial state. """
+        self.state = self.x0.copy()
+        self._elapsed = 0.0
+        self._u = 0.0
+
+    def measurement(self):
+        """ Current measured value, with the last input for the feedthrough. """
+        return self.C @ self.state + self.D * self._u
+
+    def step(self, u, dt):
+        """ Advance the plant one controller sample.
+
+        Parameters
+        ----------
+            u : float64
+                Control signal, held over the sample.
+            dt : float64
+                Controller timestep.
+
+        Returns
+        -------
+        Measured value at the end of the sample.
+        """
+        if self.Ts is None:
+            n_steps = 1
+        else:
+            self._elapsed += dt
+            n_steps = int(self._elapsed / self.Ts + 1e-9)
+            self._elapsed -= n_steps * self.Ts
+        for _ in range(n_steps):
+            self.state = self.A @ self.state + self.B * u
+        self._u = u
+        return self.measurement()
@@ -0,0 +1,11 @@
+import unittest
+
+# Guarded so the spawned training processes can import this script
+if __name__ == '__main__':
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    suite.addTests(loader.discover(start_dir='parity_test', pattern='test_*.py', top_level_dir='.'))
+
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
@@ -0,0 +1,9 @@
+import unittest
+
+loader = unittest.TestLoader()
+suite = unittest.TestSuite()
+
+suite.addTests(loader.discover(start_dir='test', pattern='test_*.py', top_level_dir='.'))
+
+runner = unittest.TextTestRunner()
+runner.run(suite)
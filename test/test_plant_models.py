@@ -0,0 +1,185 @@
+import unittest
+import numpy as np
+
+from plant_models import (Plant, ContinuousPlant, FirstOrderPlant, SecondOrderPlant, DeadTimePlant, 
+                          StateSpacePlant, euler_step, rk4_step, rk45_step)
+
+def decay(x, u):
+    """ dx/dt = u - x, exact step response 1 - exp(-t) from x = 0. """
+    return u - x
+
+class TestIntegrators(unittest.TestCase):
+    def test_euler_step(self):
+        """ Test the Euler step is the old update x += (u - x) * h."""
+        x = np.array([0.3])
+        self.assertEqual(euler_step(decay, x, 1.0, 0.1)[0], 0.3 + (1.0 - 0.3) * 0.1)
+
+    def test_rk4_order(self):
+        """ Test RK4 accuracy and fourth order convergence."""
+        errors = []
+        for h in (0.1, 0.05):
+            x = np.array([0.0])
+            for _ in range(int(round(1.0 / h))):
+                x = rk4_step(decay, x, 1.0, h)
+            errors.append(abs(x[0] - (1 - np.exp(-1.0))))
+
+        self.assertLess(errors[0], 1e-6)
+        self.assertAlmostEqual(errors[0] / errors[1], 16.0, delta=1.0)
+
+    def test_rk45_step(self):
+        """ Test the Dormand-Prince step is fifth order with a matching error estimate."""
+        h = 0.1
+        x, error = rk45_step(decay, np.array([0.0]), 1.0, h)
+        true_error = abs(x[0] - (1 - np.exp(-h)))
+
+        self.assertLess(true_error, 1e-9)
+        self.assertLess(abs(error[0]), 1e-7)
+        self.assertGreater(abs(error[0]), true_error)
+
+class TestContinuousPlant(unittest.TestCase):
+    def step_response_error(self, **kwargs):
+        """ Error of a first order plant after 1s of unit input at dt = 0.1."""
+        plant = FirstOrderPlant(**kwargs)
+        for _ in range(10):
+            y = plant.step(1.0, 0.1)
+        return abs(y - (1 - np.exp(-1.0)))
+
+    def test_accuracy(self):
+        """ Test the step response accuracy of each integrator."""
+        euler = self.step_response_error(integrator="euler")
+        self.assertLess(self.step_response_error(integrator="rk4"), 1e-6)
+        self.assertLess(self.step_response_error(integrator="rk45"), 1e-8)
+        self.assertLess(self.step_response_error(integrator="euler", max_step=0.01), euler / 5)
+
+    def test_default_matches_euler_update(self):
+        """ Test the default Euler plant reproduces measured_value += (u - y) * dt exactly."""
+        plant = FirstOrderPlant(integrator="euler")
+        measured_value = 0.0
+        for u in np.random.default_rng(0).normal(size=100):
+            expected = measured_value + (u - measured_value) * 0.1
+            measured_value = plant.step(u, 0.1)
+            self.assertEqual(measured_value, expected)
+
+    def test_adaptive_step_control(self):
+        """ Test RK45 meets its tolerance on an oscillatory plant and adapts its step."""
+        wn, zeta, dt = 50.0, 0.1, 0.01
+        plant = SecondOrderPlant(wn=wn, zeta=zeta, integrator="rk45", rtol=1e-8, atol=1e-10)
+        for _ in range(100):
+            y = plant.step(1.0, dt)
+
+        wd = wn * np.sqrt(1 - zeta ** 2)
+        exact = 1 - np.exp(-zeta * wn) / np.sqrt(1 - zeta ** 2) * np.sin(wd + np.arccos(zeta))
+        self.assertAlmostEqual(y, exact, places=6)
+        self.assertLess(plant._h, dt)
+
+        loose = SecondOrderPlant(wn=wn, zeta=zeta, integrator="rk45", rtol=1e-3, atol=1e-6)
+        for _ in range(100):
+            loose.step(1.0, dt)
+        self.assertGreater(loose._h, plant._h)
+
+    def test_adaptive_max_step(self):
+        """ Test RK45 never steps past max_step and keeps its step across samples."""
+        plant = FirstOrderPlant(integrator="rk45", max_step=0.02)
+        plant.step(1.0, 0.1)
+        self.assertLessEqual(plant._h, 0.02)
+
+        plant.reset()
+        self.assertEqual(plant._h, 0.02)
+
+    def test_adaptive_not_finite(self):
+        """ Test RK45 fails instead of hanging on a NaN input or an overflowing plant."""
+        plant = FirstOrderPlant(integrator="rk45")
+        with np.errstate(invalid="ignore"), self.assertRaises(RuntimeError):
+            plant.step(np.nan, 0.1)
+
+        unstable = FirstOrderPlant(tau=-1e-3, integrator="rk45")
+        with np.errstate(over="ignore", invalid="ignore"), self.assertRaises(RuntimeError):
+            unstable.step(1.0, 1.0)
+
+    def test_reset(self):
+        """ Test reset restores the initial state."""
+        plant = SecondOrderPlant(y0=0.5)
+        plant.step(1.0, 0.1)
+        plant.reset()
+        np.testing.assert_array_equal(plant.state, [0.5, 0.0])
+
+    def test_measurement(self):
+        """ Test the measurement starts at the initial output and follows steps."""
+        plant = FirstOrderPlant(y0=0.8)
+        self.assertEqual(plant.measurement(), 0.8)
+        y = plant.step(1.0, 0.1)
+        self.assertEqual(plant.measurement(), y)
+        plant.reset()
+        self.assertEqual(plant.measurement(), 0.8)
+        self.assertEqual(DeadTimePlant(SecondOrderPlant(y0=0.5), 0.2).measurement(), 0.5)
+
+    def test_invalid_integrator(self):
+        """ Test unknown integrators are rejected."""
+        with self.assertRaises(ValueError):
+            FirstOrderPlant(integrator="rk2")
+
+    def test_abstract(self):
+        """ Test plants missing an abstract method fail on creation."""
+        class NoDerivative(ContinuousPlant):
+            pass
+
+        class NoStep(Plant):
+            def reset(self):
+                pass
+
+        with self.assertRaises(TypeError):
+            NoDerivative([0.0])
+        with self.assertRaises(TypeError):
+            NoStep()
+
+class TestDeadTimePlant(unittest.TestCase):
+    def test_delay(self):
+        """ Test the input is delayed by whole samples and u0 is used meanwhile."""
+        inputs = np.arange(1.0, 9.0)
+        plant = DeadTimePlant(FirstOrderPlant(integrator="euler"), delay=0.3, u0=0.5)
+        reference = FirstOrderPlant(integrator="euler")
+        delayed_inputs = [0.5, 0.5, 0.5, *inputs[:-3]]
+
+        for u, u_delayed in zip(inputs, delayed_inputs):
+            self.assertEqual(plant.step(u, 0.1), reference.step(u_delayed, 0.1))
+
+    def test_reset(self):
+        """ Test reset clears the queued inputs."""
+        plant = DeadTimePlant(FirstOrderPlant(integrator="euler"), delay=0.2)
+        plant.step(1.0, 0.1)
+        plant.step(1.0, 0.1)
+        plant.reset()
+        self.assertEqual(plant.step(1.0, 0.1), 0.0)
+
+class TestStateSpacePlant(unittest.TestCase):
+    def test_one_step_per_sample(self):
+        """ Test Ts of None advances once per controller sample."""
+        plant = StateSpacePlant([[0.9]], [0.1], [1.0])
+        self.assertAlmostEqual(plant.step(1.0, 0.1), 0.1)
+        self.assertAlmostEqual(plant.step(1.0, 0.1), 0.19)
+
+    def test_sample_period_carry_over(self):
+        """ Test the remainder of Ts carries over between controller samples."""
+        plant = StateSpacePlant([[1.0]], [1.0], [1.0], Ts=0.15)
+        counts = [plant.step(1.0, 0.1) for _ in range(6)]
+
+        # Cumulative plant samples at Ts = 0.15 after each 0.1s controller sample
+        np.testing.assert_allclose(counts, [0, 1, 2, 2, 3, 4])
+
+    def test_feedthrough(self):
+        """ Test the D term and multi state matrices."""
+        plant = StateSpacePlant([[0.0, 1.0], [-0.5, 1.0]], [0.0, 1.0], [1.0, 0.0], D=2.0)
+        self.assertAlmostEqual(plant.step(1.0, 0.1), 2.0)
+        self.assertAlmostEqual(plant.step(1.0, 0.1), 3.0)
+
+    def test_measurement(self):
+        """ Test the measurement of a nonzero initial state and the last feedthrough."""
+        plant = StateSpacePlant([[0.9]], [0.1], [2.0], D=1.0, x0=[0.5])
+        self.assertEqual(plant.measurement(), 1.0)
+        y = plant.step(1.0, 0.1)
+        self.assertEqual(plant.measurement(), y)
+        plant.reset()
+        self.assertEqual(plant.measurement(), 1.0)
+
+if __name__ == '__main__':
+    unittest.main()